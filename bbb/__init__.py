@@ -1,34 +1,65 @@
 # BBB (Boredom Buster Bot) shared library
-# Servo imports
-from bbb.servo import (
-    ServoController,
-    SERVO_ENABLED,
-    GPIO_PIN,
-    HAND_DOWN,
-    HAND_UP,
-    HAND_MIDDLE,
-    MOUTH_CLOSED,
-    MOUTH_OPEN,
-    MOUTH_HALF,
-    init_servo,
-    get_servo,
-    get_servo_lock,
-    get_servo_error,
-    move_hand,
-    hand_talking_animation,
-    joke_setup_animation,
-    punchline_animation,
-    hand_slap_animation,
-)
+#
+# Submodules are imported on first attribute access (PEP 562), so e.g.
+# `from bbb import speak_text_sync` doesn't also load the servo module.
+import importlib
 
-# TTS imports
-from bbb.tts import (
-    check_tts_available,
-    init_tts,
-    get_tts_command,
-    speak_with_pico,
-    speak_with_espeak,
-    speak_text_sync,
-    speak_text_async,
-)
+_LAZY = {
+    # Servo
+    'ServoController': 'bbb.servo',
+    'NullServo': 'bbb.servo',
+    'SERVO_ENABLED': 'bbb.servo',
+    'GPIO_PIN': 'bbb.servo',
+    'HAND_DOWN': 'bbb.servo',
+    'HAND_UP': 'bbb.servo',
+    'HAND_MIDDLE': 'bbb.servo',
+    'MOUTH_CLOSED': 'bbb.servo',
+    'MOUTH_OPEN': 'bbb.servo',
+    'MOUTH_HALF': 'bbb.servo',
+    'init_servo': 'bbb.servo',
+    'get_servo': 'bbb.servo',
+    'get_servo_lock': 'bbb.servo',
+    'get_servo_error': 'bbb.servo',
+    'move_hand': 'bbb.servo',
+    'move_mouth': 'bbb.servo',
+    'hand_talking_animation': 'bbb.servo',
+    'mouth_talking_animation': 'bbb.servo',
+    'joke_setup_animation': 'bbb.servo',
+    'punchline_animation': 'bbb.servo',
+    'hand_slap_animation': 'bbb.servo',
+    'laugh_animation': 'bbb.servo',
+    'start_animation': 'bbb.servo',
+    'play_steps': 'bbb.servo',
+    # Jokes
+    'JOKES_PATH': 'bbb.jokes',
+    'JokeIndex': 'bbb.jokes',
+    'load_jokes': 'bbb.jokes',
+    'get_jokes': 'bbb.jokes',
+    # TTS
+    'LAUGH_TEXT': 'bbb.tts',
+    'check_tts_available': 'bbb.tts',
+    'init_tts': 'bbb.tts',
+    'get_tts_command': 'bbb.tts',
+    'get_tts_lock': 'bbb.tts',
+    'get_tts_error': 'bbb.tts',
+    'is_speech_queued': 'bbb.tts',
+    'speak_with_pico': 'bbb.tts',
+    'speak_with_espeak': 'bbb.tts',
+    'speak_with_say': 'bbb.tts',
+    'speak_text_sync': 'bbb.tts',
+    'speak_text_async': 'bbb.tts',
+}
 
+__all__ = list(_LAZY)
+
+
+def __getattr__(name):
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY[name]), name)
+    globals()[name] = value  # Cache so __getattr__ isn't hit again
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Joke loading for BBB (Boredom Buster Bot)
+Shared by sir.py and web.py, so the jokes are read in one place.
+"""
+
+import os
+
+__all__ = [
+    'JOKES_PATH',
+    'JokeIndex',
+    'load_jokes',
+    'get_jokes',
+]
+
+# dad_jokes.json lives next to sir.py and web.py, one level up from here
+_ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+JOKES_PATH = os.path.join(_ROOT_DIR, 'dad_jokes.json')
+# Cached byte offsets of the jokes in JOKES_PATH (rebuilt when it's stale)
+_INDEX_PATH = os.path.join(_ROOT_DIR, 'dad_jokes.idx')
+# Pickle of the parsed jokes (rebuilt when it's stale)
+_CACHE_PATH = os.path.join(_ROOT_DIR, 'dad_jokes.pkl')
+
+# Parsed jokes, shared by everything in the process (see get_jokes)
+_jokes = None
+
+
+class JokeIndex:
+    """
+    Read-only sequence of the jokes in dad_jokes.json.
+    
+    The file is memory-mapped and only the joke that's asked for is
+    decoded, so picking one joke doesn't parse all of them.
+    """
+    
+    def __init__(self, json_path=JOKES_PATH, index_path=_INDEX_PATH):
+        import json
+        import mmap
+        self._decoder = json.JSONDecoder()
+        with open(json_path, 'rb') as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._offsets = self._load_offsets(json_path, index_path)
+    
+    def _load_offsets(self, json_path, index_path):
+        """Read the cached offsets if fresh, otherwise rebuild and save them."""
+        from array import array
+        offsets = array('Q')
+        try:
+            if os.stat(index_path).st_mtime >= os.stat(json_path).st_mtime:
+                with open(index_path, 'rb') as f:
+                    offsets.frombytes(f.read())
+                if len(offsets) > 1 and offsets[-1] < len(self._mm):
+                    return offsets
+                offsets = array('Q')
+        except (OSError, ValueError):
+            offsets = array('Q')
+        
+        self._build_offsets(offsets)
+        try:
+            with open(index_path, 'wb') as f:
+                offsets.tofile(f)
+        except OSError:
+            pass  # Read-only checkout; just rebuild next time
+        return offsets
+    
+    def _build_offsets(self, offsets):
+        """
+        Walk the "jokes" array once, recording where each joke object
+        starts, followed by the position of the closing bracket.
+        """
+        import re
+        separators = re.compile(r'[\s,]*')
+        
+        # latin-1 maps bytes 1:1 to characters, so positions are byte offsets
+        text = self._mm[:].decode('latin-1')
+        pos = text.index('[', text.index('"jokes"')) + 1
+        while True:
+            pos = separators.match(text, pos).end()
+            if text.startswith(']', pos):
+                break
+            offsets.append(pos)
+            _, pos = self._decoder.raw_decode(text, pos)
+        offsets.append(pos)
+    
+    def __len__(self):
+        return len(self._offsets) - 1
+    
+    def __getitem__(self, i):
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError('joke index out of range')
+        # The slice runs up to the next joke; raw_decode ignores the comma
+        chunk = self._mm[self._offsets[i]:self._offsets[i + 1]].decode('utf-8')
+        return self._decoder.raw_decode(chunk)[0]
+
+
+def load_jokes(json_path=JOKES_PATH, cache_path=_CACHE_PATH):
+    """
+    Load all jokes, from a pickle of the parsed list when it's at least as
+    new as dad_jokes.json (unpickling is much cheaper than parsing JSON).
+    
+    Returns:
+        tuple: Joke dicts with 'setup' and 'punchline'
+    """
+    import pickle
+    try:
+        if os.stat(cache_path).st_mtime >= os.stat(json_path).st_mtime:
+            with open(cache_path, 'rb') as f:
+                return pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError):
+        pass
+    
+    with open(json_path, 'rb') as f:
+        data = f.read()
+    try:
+        import orjson  # Optional, faster parser
+        jokes = tuple(orjson.loads(data)['jokes'])
+    except ImportError:
+        import json
+        jokes = tuple(json.loads(data)['jokes'])
+    
+    try:
+        # Write then rename, so a reader never sees a half-written cache
+        tmp_path = cache_path + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(jokes, f, pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass  # Read-only checkout; just parse the JSON next time
+    return jokes
+
+
+def get_jokes():
+    """
+    Get the jokes, loading them on first call.
+    
+    Every caller shares the one immutable tuple, so when a server loads
+    it before forking (e.g. gunicorn --preload) the workers share it too.
+    
+    Returns:
+        tuple: Joke dicts with 'setup' and 'punchline'
+    """
+    global _jokes
+    if _jokes is None:
+        _jokes = tuple(load_jokes())  # tuple() is free on a tuple
+    return _jokes
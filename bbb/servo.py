@@ -4,13 +4,49 @@ Servo controller module for BBB (Boredom Buster Bot)
 Handles servo initialization and hand slap animations.
 """
 
+import itertools
+import math
 import os
 import time
 import threading
+from concurrent.futures import ThreadPoolExecutor
+
+__all__ = [
+    'ServoController',
+    'NullServo',
+    'SERVO_ENABLED',
+    'GPIO_PIN',
+    'HAND_DOWN',
+    'HAND_UP',
+    'HAND_MIDDLE',
+    'MOUTH_CLOSED',
+    'MOUTH_OPEN',
+    'MOUTH_HALF',
+    'init_servo',
+    'get_servo',
+    'get_servo_lock',
+    'get_servo_error',
+    'move_hand',
+    'move_mouth',
+    'hand_talking_animation',
+    'mouth_talking_animation',
+    'joke_setup_animation',
+    'punchline_animation',
+    'hand_slap_animation',
+    'laugh_animation',
+    'start_animation',
+    'play_steps',
+]
 
 # Servo configuration
 SERVO_ENABLED = True
 GPIO_PIN = 18
+GPIO_CHIP = 0       # gpiochip for lgpio (Pi 5 on kernels before 6.6.45: 4)
+
+# Hardware PWM (needs dtoverlay=pwm-2chan and the rpi-hardware-pwm package):
+# pwmchip and channel for each PWM-capable GPIO on the Pi 5
+HW_PWM_CHIP = 0     # (older Pi 5 kernels: 2)
+HW_PWM_CHANNELS = {12: 0, 13: 1, 18: 2, 19: 3}
 
 # Hand positions (0° = touching ground, 180° = fully raised)
 HAND_DOWN = 0       # Hand touching ground (rest position)
@@ -22,45 +58,245 @@ MOUTH_CLOSED = HAND_DOWN
 MOUTH_OPEN = HAND_UP
 MOUTH_HALF = HAND_MIDDLE
 
+# True in the Flask debug parent process that only watches for reloads
+_IS_FLASK_RELOADER = (os.environ.get('WERKZEUG_RUN_MAIN') != 'true'
+                      and os.environ.get('FLASK_DEBUG') == '1')
+
 # Global servo instance and lock
 _servo = None
 _servo_lock = threading.Lock()
 _servo_error = None
 
+# One reused thread for start_animation, and the stop event of the
+# animation it's running (set to cut that one short)
+_animation_executor = None
+_animation_stop = None
+_animation_start_lock = threading.Lock()
+
+
+def _clamp180(angle):
+    """Clamp an angle to 0-180 as a whole degree (one chained conditional)."""
+    return 0 if angle < 0 else 180 if angle > 180 else int(angle)
+
 
 class ServoController:
-    """PWM-based servo controller for Raspberry Pi."""
+    """
+    Servo controller for Raspberry Pi.
     
-    def __init__(self, gpio_pin, min_duty=0.025, max_duty=0.125, freq=50):
-        os.environ['GPIOZERO_PIN_FACTORY'] = 'lgpio'
-        from gpiozero import PWMOutputDevice
-        
+    Uses the SoC's hardware PWM on PWM-capable pins when it's set up
+    (jitter-free, no CPU involved). Otherwise drives the pin with lgpio's
+    servo pulse generator (pulses timed in lgpio's C thread, not in
+    Python), and falls back to a gpiozero PWMOutputDevice after that.
+    """
+    
+    def __init__(self, gpio_pin, min_pulse_us=500, max_pulse_us=2500, freq=50):
         self.gpio = gpio_pin
-        self.min_duty = min_duty
-        self.max_duty = max_duty
-        self.pwm = PWMOutputDevice(gpio_pin, frequency=freq, initial_value=0)
+        self.min_pulse_us = min_pulse_us
+        self.max_pulse_us = max_pulse_us
+        self.freq = freq
         self.current_angle = None
+        self._release_timer = None
+        # Makes cancelling a scheduled release and that release running
+        # mutually exclusive, so a timer can't stop a newer move's pulses
+        self._release_lock = threading.Lock()
+        # True while pulses are being output, so release() can skip a
+        # redundant stop (e.g. several callers releasing in a row)
+        self._pulsing = False
+        
+        # Pulse width in whole microseconds for every whole degree (integer
+        # math, so lgpio gets exactly these values), computed once
+        pulse_range = max_pulse_us - min_pulse_us
+        self._pulse_lut = tuple(min_pulse_us + (a * pulse_range) // 180 for a in range(181))
+        # ...and the matching duty cycle for hardware PWM / gpiozero
+        period_us = 1000000 // freq
+        self._duty_lut = tuple(p / period_us for p in self._pulse_lut)
+        
+        self.pwm = None
+        self._hw_pwm = None
+        self._lgpio = None
+        self._chip = None
+        try:
+            self._open_hw_pwm()
+        except Exception:
+            try:
+                self._open_lgpio()
+            except Exception:
+                # lgpio itself is unusable, so don't force gpiozero's lgpio
+                # factory either: let it pick one (or use GPIOZERO_PIN_FACTORY)
+                from gpiozero import PWMOutputDevice
+                self.pwm = PWMOutputDevice(gpio_pin, frequency=freq, initial_value=0)
+    
+    def _open_hw_pwm(self):
+        """Use the pin's hardware PWM channel (raises if it isn't available)."""
+        from rpi_hardware_pwm import HardwarePWM
+        self._hw_pwm = HardwarePWM(pwm_channel=HW_PWM_CHANNELS[self.gpio],
+                                   hz=self.freq, chip=HW_PWM_CHIP)
     
-    def angle_to_duty(self, angle):
-        """Convert angle (0-180) to duty cycle."""
-        angle = max(0, min(180, angle))
-        duty_range = self.max_duty - self.min_duty
-        return self.min_duty + (angle / 180.0) * duty_range
+    def _open_lgpio(self):
+        """Claim the pin through lgpio directly."""
+        import lgpio
+        chip = lgpio.gpiochip_open(GPIO_CHIP)
+        try:
+            lgpio.gpio_claim_output(chip, self.gpio)
+        except Exception:
+            lgpio.gpiochip_close(chip)
+            raise
+        self._lgpio = lgpio
+        self._chip = chip
+    
+    def _write(self, angle):
+        """Output the pulse for a whole-degree angle (0-180)."""
+        if self._lgpio:
+            self._lgpio.tx_servo(self._chip, self.gpio, self._pulse_lut[angle], self.freq)
+        elif self._hw_pwm:
+            # rpi-hardware-pwm takes the duty cycle in percent
+            if self._pulsing:
+                self._hw_pwm.change_duty_cycle(self._duty_lut[angle] * 100)
+            else:
+                self._hw_pwm.start(self._duty_lut[angle] * 100)
+        else:
+            self.pwm.value = self._duty_lut[angle]
+        self._pulsing = True
     
     def set_angle(self, angle):
         """Move servo to angle (0-180)."""
-        angle = max(0, min(180, angle))
-        self.pwm.value = self.angle_to_duty(angle)
+        self._set_angle_unchecked(_clamp180(angle))
+    
+    def _set_angle_unchecked(self, angle):
+        """Move servo to a whole-degree angle already known to be 0-180."""
+        self._cancel_release()
+        self._write(angle)
         self.current_angle = angle
     
+    def queue_steps(self, steps):
+        """
+        Hand a whole movement to lgpio, which plays it from its TX queue
+        (no Python timing involved) and stops pulses after the last step.
+        
+        Args:
+            steps: Sequence of (angle, seconds to hold) pairs, angles 0-180
+            
+        Returns:
+            bool: True if queued, False if unsupported (no lgpio, or not
+            enough queue room) and the caller should step it itself
+        """
+        lgpio = self._lgpio
+        if not lgpio or lgpio.tx_room(self._chip, self.gpio, lgpio.TX_PWM) < len(steps):
+            return False
+        
+        self._cancel_release()
+        for angle, seconds in steps:
+            cycles = max(1, int(round(seconds * self.freq)))
+            lgpio.tx_servo(self._chip, self.gpio, self._pulse_lut[angle], self.freq, 0, cycles)
+        self.current_angle = steps[-1][0]
+        self._pulsing = True  # Until lgpio reaches the end of the queue
+        return True
+    
+    def set_angle_blocking(self, angle, settle_time=0.3, hold=False):
+        """
+        Move servo to angle, wait for it to get there, then release.
+        
+        Args:
+            angle: Target angle (0-180)
+            settle_time: Seconds to let the servo reach position
+            hold: If True, keep PWM signal active (may cause jitter)
+        """
+        self.set_angle(angle)
+        time.sleep(settle_time)
+        if not hold:
+            self.release()
+    
+    def set_angle_and_release(self, angle, settle_time=0.3):
+        """
+        Move servo to angle and return at once, releasing it from a timer
+        thread after settle_time (a later move or hold() cancels that).
+        
+        Args:
+            angle: Target angle (0-180)
+            settle_time: Seconds to let the servo reach position
+        """
+        self.set_angle(angle)
+        timer = threading.Timer(settle_time, lambda: self._timed_release(timer))
+        timer.daemon = True
+        self._release_timer = timer
+        timer.start()
+    
+    def _timed_release(self, timer):
+        """Release for a set_angle_and_release timer, unless it's been cancelled."""
+        with _servo_lock, self._release_lock:
+            if self._release_timer is not timer:
+                return  # A later move (or hold) superseded it
+            self._release_timer = None
+            self.release()
+    
+    def _cancel_release(self):
+        """Cancel a release scheduled by set_angle_and_release, if any."""
+        with self._release_lock:
+            if self._release_timer:
+                self._release_timer.cancel()
+                self._release_timer = None
+    
+    def hold(self):
+        """Re-engage servo at current angle."""
+        self._cancel_release()
+        if self.current_angle is not None:
+            self._write(self.current_angle)
+    
     def release(self):
         """Stop PWM signal (servo won't hold position but won't jitter)."""
-        self.pwm.value = 0
+        if not self._pulsing:
+            return
+        if self._lgpio:
+            self._lgpio.tx_servo(self._chip, self.gpio, 0)
+        elif self._hw_pwm:
+            self._hw_pwm.stop()
+        else:
+            self.pwm.value = 0
+        self._pulsing = False
     
     def cleanup(self):
         """Release resources."""
-        self.pwm.value = 0
-        self.pwm.close()
+        self._cancel_release()
+        self.release()
+        if self._lgpio:
+            self._lgpio.gpio_free(self._chip, self.gpio)
+            self._lgpio.gpiochip_close(self._chip)
+        elif self.pwm:
+            self.pwm.close()
+
+
+class NullServo:
+    """
+    Stand-in for a ServoController when there's no servo: every command is
+    a no-op, so callers needn't guard each call. Falsy, so `if servo:`
+    still tells whether a real servo is connected.
+    """
+    
+    current_angle = None
+    
+    def __bool__(self):
+        return False
+    
+    def set_angle(self, angle):
+        pass
+    
+    def set_angle_blocking(self, angle, settle_time=0.3, hold=False):
+        pass
+    
+    def set_angle_and_release(self, angle, settle_time=0.3):
+        pass
+    
+    def queue_steps(self, steps):
+        return False
+    
+    def hold(self):
+        pass
+    
+    def release(self):
+        pass
+    
+    def cleanup(self):
+        pass
 
 
 def init_servo(skip_if_reloader=False):
@@ -80,16 +316,13 @@ def init_servo(skip_if_reloader=False):
     
     # Check for Flask reloader
     if skip_if_reloader:
-        is_reloader = os.environ.get('WERKZEUG_RUN_MAIN') != 'true' and os.environ.get('FLASK_DEBUG') == '1'
-        if is_reloader:
+        if _IS_FLASK_RELOADER:
             print("⏳ Skipping servo init in reloader process...")
             return None, "Reloader process"
     
     try:
         _servo = ServoController(GPIO_PIN)
-        _servo.set_angle(HAND_DOWN)
-        time.sleep(0.3)
-        _servo.release()
+        _servo.set_angle_blocking(HAND_DOWN)
         print(f"🤖 Servo initialized on GPIO {GPIO_PIN} (hand at rest)")
         return _servo, None
     except Exception as e:
@@ -114,6 +347,32 @@ def get_servo_error():
     return _servo_error
 
 
+def _locked_set_angle(angle):
+    """Move the servo (angle already 0-180) while holding the servo lock."""
+    with _servo_lock:
+        _servo._set_angle_unchecked(angle)
+
+
+def _locked_release():
+    """Release the servo while holding the servo lock."""
+    with _servo_lock:
+        _servo.release()
+
+
+def _servo_ops(use_lock):
+    """
+    Pick the set_angle/release callables once, instead of checking
+    use_lock on every servo command. The set_angle callable skips clamping,
+    so only pass it the animations' fixed 0-180 angles.
+    
+    Returns:
+        tuple: (set_angle, release) callables
+    """
+    if use_lock:
+        return _locked_set_angle, _locked_release
+    return _servo._set_angle_unchecked, _servo.release
+
+
 def move_hand(angle, use_lock=False):
     """Move servo to specified angle if available."""
     if _servo:
@@ -128,41 +387,150 @@ def move_hand(angle, use_lock=False):
 move_mouth = move_hand
 
 
-def hand_talking_animation(duration=2.0, use_lock=False):
-    """Animate hand while talking (small up/down movements)."""
+def _sleep_until(deadline, stop=None):
+    """
+    Sleep until a time.monotonic() deadline (returns at once if already past).
+    
+    Args:
+        deadline: time.monotonic() value to sleep until
+        stop: Optional threading.Event that cuts the sleep short
+        
+    Returns:
+        bool: True if stop is set
+    """
+    remaining = deadline - time.monotonic()
+    if stop:
+        return stop.wait(remaining) if remaining > 0 else stop.is_set()
+    if remaining > 0:
+        time.sleep(remaining)
+    return False
+
+
+# One up/down cycle of the talking animation, as (angle, seconds to hold)
+_TALK_STEPS = (
+    (HAND_MIDDLE, 0.15),
+    (HAND_DOWN, 0.1),
+)
+_TALK_CYCLE_SECONDS = sum(seconds for _, seconds in _TALK_STEPS)
+# How long the hand gets to reach HAND_DOWN (the down step) before release
+_TALK_DOWN_SECONDS = _TALK_STEPS[-1][1]
+
+
+def _put_hand_down(use_lock):
+    """Move the hand down, give it time to get there, then release it."""
+    set_angle, release = _servo_ops(use_lock)
+    set_angle(HAND_DOWN)
+    time.sleep(_TALK_DOWN_SECONDS)
+    release()
+
+
+def hand_talking_animation(duration=2.0, use_lock=False, stop=None):
+    """
+    Animate hand while talking (small up/down movements).
+    
+    Args:
+        duration: Seconds to animate for (None: until stop is set)
+        use_lock: If True, hold the servo lock for each servo command
+        stop: Optional threading.Event that ends the animation as soon as
+            it's set, e.g. when the speech has finished playing
+    """
     if not _servo:
         return
     
-    start_time = time.time()
-    while time.time() - start_time < duration:
-        if use_lock:
-            with _servo_lock:
-                _servo.set_angle(HAND_MIDDLE)
-        else:
-            _servo.set_angle(HAND_MIDDLE)
-        time.sleep(0.15)
-        
-        if use_lock:
-            with _servo_lock:
-                _servo.set_angle(HAND_DOWN)
-        else:
-            _servo.set_angle(HAND_DOWN)
-        time.sleep(0.1)
+    if duration is not None:
+        # Known length: play it as a fixed list of steps, which lgpio can
+        # run from its TX queue with no Python wakeups at all
+        cycles = max(1, math.ceil(duration / _TALK_CYCLE_SECONDS))
+        _play_steps(_TALK_STEPS * cycles, use_lock, stop)
+        if stop and stop.is_set():
+            # Cut short, maybe mid-move: put the hand back down
+            _put_hand_down(use_lock)
+        return
     
+    set_angle, release = _servo_ops(use_lock)
+    
+    # Pace against absolute deadlines so sleep overhead doesn't accumulate
+    deadline = time.monotonic()
+    for angle, seconds in itertools.cycle(_TALK_STEPS):
+        set_angle(angle)
+        deadline += seconds
+        if _sleep_until(deadline, stop):
+            break
+    
+    _put_hand_down(use_lock)
+
+
+# Legacy alias
+mouth_talking_animation = hand_talking_animation
+
+
+def _play_steps(steps, use_lock=False, stop=None):
+    """Play (angle, seconds to hold) steps, then release the servo."""
     if use_lock:
         with _servo_lock:
-            _servo.set_angle(HAND_DOWN)
-            _servo.release()
+            queued = _servo.queue_steps(steps)
     else:
-        _servo.set_angle(HAND_DOWN)
-        _servo.release()
+        queued = _servo.queue_steps(steps)
+    
+    set_angle, release = _servo_ops(use_lock)
+    _finish_steps(steps, queued, set_angle, release, stop)
 
 
-# Legacy alias
-mouth_talking_animation = hand_talking_animation
+def play_steps(servo, steps, stop=None):
+    """
+    Play (angle, seconds to hold) steps on any ServoController (e.g. one
+    with its own pulse widths, as in servo_test.py), then release it. Like
+    the animations, but without the servo lock.
+    
+    Args:
+        servo: ServoController to move
+        steps: Sequence of (angle, seconds to hold) pairs, angles 0-180
+        stop: Optional threading.Event that cuts the steps short
+    """
+    _finish_steps(steps, servo.queue_steps(steps), servo.set_angle, servo.release, stop)
 
 
-def joke_setup_animation(use_lock=False):
+def _finish_steps(steps, queued, set_angle, release, stop):
+    """Wait out steps lgpio has queued, or step through them; then release."""
+    if queued:
+        # lgpio plays the steps and stops pulses itself; just wait it out
+        # (or cut the rest of it off if stopped)
+        if _sleep_until(time.monotonic() + sum(seconds for _, seconds in steps), stop):
+            release()
+        return
+    
+    deadline = time.monotonic()
+    for angle, seconds in steps:
+        set_angle(angle)
+        deadline += seconds
+        if _sleep_until(deadline, stop):
+            break
+    release()
+
+
+# Fixed animations as (angle, seconds to hold) steps
+_SETUP_STEPS = (
+    (HAND_DOWN, 0.1),       # Start position
+    (130, 0.5),             # Raise arm up to 130°
+    (HAND_DOWN, 0.3),       # Back down to 0°
+)
+
+_PUNCHLINE_STEPS = (
+    (HAND_DOWN, 0.1),       # Start position
+    (HAND_MIDDLE, 0.4),     # Raise arm to 90° (middle)
+    (HAND_DOWN, 0.3),       # Back down to 0°
+)
+
+_SLAP_STEPS = (
+    (HAND_DOWN, 0.1),       # Start position (should already be here)
+    (HAND_UP, 0.3),         # Raise hand up
+    (HAND_DOWN, 0.2),       # SLAP down!
+    (HAND_MIDDLE, 0.25),    # Bounce up to middle
+    (HAND_DOWN, 0.2),       # Back down to rest
+)
+
+
+def joke_setup_animation(use_lock=False, stop=None):
     """
     Animate arm during joke setup (telling the joke).
     Pattern: 0° → 130° → 0°
@@ -171,33 +539,10 @@ def joke_setup_animation(use_lock=False):
     if not _servo:
         return
     
-    def set_angle(angle):
-        if use_lock:
-            with _servo_lock:
-                _servo.set_angle(angle)
-        else:
-            _servo.set_angle(angle)
-    
-    # Start position
-    set_angle(HAND_DOWN)
-    time.sleep(0.1)
-    
-    # Raise arm up to 130°
-    set_angle(130)
-    time.sleep(0.5)
-    
-    # Back down to 0°
-    set_angle(HAND_DOWN)
-    time.sleep(0.3)
-    
-    if use_lock:
-        with _servo_lock:
-            _servo.release()
-    else:
-        _servo.release()
+    _play_steps(_SETUP_STEPS, use_lock, stop)
 
 
-def punchline_animation(use_lock=False):
+def punchline_animation(use_lock=False, stop=None):
     """
     Animate arm on punchline reveal.
     Pattern: 0° → 90° → 0°
@@ -206,33 +551,10 @@ def punchline_animation(use_lock=False):
     if not _servo:
         return
     
-    def set_angle(angle):
-        if use_lock:
-            with _servo_lock:
-                _servo.set_angle(angle)
-        else:
-            _servo.set_angle(angle)
-    
-    # Start position
-    set_angle(HAND_DOWN)
-    time.sleep(0.1)
-    
-    # Raise arm to 90° (middle)
-    set_angle(HAND_MIDDLE)
-    time.sleep(0.4)
-    
-    # Back down to 0°
-    set_angle(HAND_DOWN)
-    time.sleep(0.3)
-    
-    if use_lock:
-        with _servo_lock:
-            _servo.release()
-    else:
-        _servo.release()
+    _play_steps(_PUNCHLINE_STEPS, use_lock, stop)
 
 
-def hand_slap_animation(use_lock=False):
+def hand_slap_animation(use_lock=False, stop=None):
     """
     Animate hand slapping (full slap).
     Pattern: 0° → 180° → 0° → 90° → 0°
@@ -241,40 +563,42 @@ def hand_slap_animation(use_lock=False):
     if not _servo:
         return
     
-    def set_angle(angle):
-        if use_lock:
-            with _servo_lock:
-                _servo.set_angle(angle)
-        else:
-            _servo.set_angle(angle)
-    
-    # Start position (should already be here)
-    set_angle(HAND_DOWN)
-    time.sleep(0.1)
-    
-    # Raise hand up
-    set_angle(HAND_UP)
-    time.sleep(0.3)
-    
-    # SLAP down!
-    set_angle(HAND_DOWN)
-    time.sleep(0.2)
-    
-    # Bounce up to middle
-    set_angle(HAND_MIDDLE)
-    time.sleep(0.25)
-    
-    # Back down to rest
-    set_angle(HAND_DOWN)
-    time.sleep(0.2)
-    
-    if use_lock:
-        with _servo_lock:
-            _servo.release()
-    else:
-        _servo.release()
+    _play_steps(_SLAP_STEPS, use_lock, stop)
 
 
 # Legacy alias
 laugh_animation = hand_slap_animation
 
+
+def _run_animation(animation, args, stop):
+    """Run a started animation, unless a newer one replaced it while queued."""
+    if not stop.is_set():
+        animation(*args, stop=stop)
+
+
+def start_animation(animation, *args, stop=None):
+    """
+    Run an animation on the shared animation thread, cutting short the one
+    in progress (if any) instead of starting a thread per animation. One
+    still waiting its turn is dropped, so bursts of requests don't pile up.
+    
+    Args:
+        animation: An animation function taking a stop keyword argument,
+            e.g. hand_slap_animation
+        *args: Positional arguments for it, e.g. use_lock
+        stop: Optional threading.Event the caller can set to cut this
+            animation short (one is made if None)
+        
+    Returns:
+        concurrent.futures.Future: Resolves when the animation has finished
+    """
+    global _animation_executor, _animation_stop
+    with _animation_start_lock:
+        if _animation_executor is None:
+            _animation_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='servo')
+        if _animation_stop:
+            _animation_stop.set()
+        if stop is None:
+            stop = threading.Event()
+        _animation_stop = stop
+        return _animation_executor.submit(_run_animation, animation, args, stop)
@@ -4,21 +4,133 @@ Text-to-speech module for BBB (Boredom Buster Bot)
 Supports pico2wave (natural), espeak (robotic), and macOS say.
 """
 
+import atexit
+import hashlib
 import os
+import select
 import shutil
+import signal
+import stat
 import subprocess
 import tempfile
 import threading
+import wave
+from concurrent.futures import ThreadPoolExecutor
+
+__all__ = [
+    'LAUGH_TEXT',
+    'check_tts_available',
+    'init_tts',
+    'get_tts_command',
+    'get_tts_lock',
+    'get_tts_error',
+    'is_speech_queued',
+    'speak_with_pico',
+    'speak_with_espeak',
+    'speak_with_say',
+    'speak_text_sync',
+    'speak_text_async',
+]
 
 # TTS lock for thread-safe access
 _tts_lock = threading.Lock()
 
+# Single reused worker thread for speak_text_async (speech is serial anyway)
+_tts_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='tts')
+
+# TTS engines, most preferred (most natural sounding) first
+_TTS_ENGINES = ('pico2wave', 'espeak', 'say')
+
 # Cached TTS command
 _tts_command = None
 
+# Why the last utterance failed (None if it played)
+_tts_error = None
+
 # Audio player: prefer paplay (PulseAudio) for system default output
 _audio_player = None
 
+# Scratch WAV, overwritten per utterance; kept in RAM (tmpfs) when available
+# to avoid SD-card writes
+_TMP_DIR = '/dev/shm' if os.path.isdir('/dev/shm') else tempfile.gettempdir()
+
+# Rendered pico2wave utterances, kept (in the same RAM-backed place) so a
+# repeated line is just played again; also shared between this user's
+# processes, so the CLI benefits across runs. One private directory per
+# user, since whatever is in it gets spoken. The least recently used are
+# dropped first.
+_WAV_CACHE_DIR = os.path.join(_TMP_DIR, f'bbb_tts_cache-{os.getuid()}')
+_WAV_CACHE_MAX = 200    # Files (a few MB at pico2wave's 16kHz mono)
+
+# The laugh line, and a pre-rendered WAV of it (set by init_tts)
+LAUGH_TEXT = "Ha ha ha ha! That's a good one!"
+_laugh_wav = None
+
+# espeak voice options: -a 200 = max volume, -s 100 = slow speed,
+# -g 15 = longer gaps between words
+_ESPEAK_ARGS = ['-a', '200', '-s', '100', '-g', '15']
+
+# Long-running espeak (and the player it streams to), fed one line per
+# utterance; only started by init_tts(persistent=True)
+_espeak_proc = None
+_espeak_player = None
+
+# Seconds any one synthesis process may run before it's taken to be wedged
+# and killed (so it can't hold the TTS lock forever)
+_PROCESS_TIMEOUT = 30
+
+# Anything that plays audio runs as long as the speech does, so it's only
+# killed this many seconds past the audio's length...
+_PLAYBACK_MARGIN = 10
+# ...or, when only the text is known, past a generous estimate of it
+# (espeak at -s 100 says about 0.08s per character)
+_MAX_SECONDS_PER_CHAR = 0.25
+
+# Resolved executable paths by command name (each shutil.which is a PATH scan)
+_which_cache = {}
+
+
+def _which(cmd):
+    """Look up an executable on PATH, caching the result."""
+    if cmd not in _which_cache:
+        _which_cache[cmd] = shutil.which(cmd)
+    return _which_cache[cmd]
+
+
+def _run(cmd, timeout=_PROCESS_TIMEOUT):
+    """
+    Run a command to completion, like subprocess.run(cmd, check=False).
+    
+    Uses posix_spawn with the cached executable path where available, so
+    no copy of this process is forked and PATH isn't searched again.
+    
+    Args:
+        cmd: Command line to run
+        timeout: Seconds after which the command is killed as wedged
+            (None for no limit)
+        
+    Returns:
+        int: The command's exit status (negative signal number if killed)
+    """
+    if not hasattr(os, 'posix_spawn') or not hasattr(os, 'pidfd_open'):
+        try:
+            return subprocess.run(cmd, executable=_which(cmd[0]), check=False,
+                                  timeout=timeout).returncode
+        except subprocess.TimeoutExpired:
+            return -signal.SIGKILL  # subprocess.run killed it
+    
+    pid = os.posix_spawn(_which(cmd[0]) or cmd[0], cmd, os.environ)
+    # Wait on a pidfd so the wait can time out; the child isn't reaped
+    # until waitpid, so its pid can't have been reused when it's killed
+    pidfd = os.pidfd_open(pid)
+    try:
+        if not select.select([pidfd], [], [], timeout)[0]:
+            os.kill(pid, signal.SIGKILL)
+    finally:
+        os.close(pidfd)
+    _, status = os.waitpid(pid, 0)
+    return os.waitstatus_to_exitcode(status)
+
 
 def _get_audio_player():
     """Get the best available audio player for WAV files."""
@@ -30,34 +142,118 @@ def _get_audio_player():
         # ffplay = FFmpeg (good fallback)
         # aplay = ALSA direct (may go to wrong output)
         for player in ['pw-play', 'paplay', 'ffplay', 'aplay']:
-            if shutil.which(player):
+            if _which(player):
                 _audio_player = player
                 break
     return _audio_player
 
 
+def _wav_duration(wav_file):
+    """Length of a WAV file in seconds, or None if it can't be read."""
+    try:
+        with wave.open(wav_file, 'rb') as w:
+            return w.getnframes() / float(w.getframerate())
+    except (OSError, EOFError, ZeroDivisionError, wave.Error):
+        return None
+
+
+def _notify_start(on_start, duration=None):
+    """Tell the caller playback is starting (duration in seconds, or None)."""
+    if on_start:
+        on_start(duration)
+
+
+def _player_command(player, wav_file='-'):
+    """
+    Build the command line for an audio player.
+    
+    Args:
+        player: Audio player name from _get_audio_player()
+        wav_file: Path of the WAV file to play, or '-' to read from stdin
+        
+    Returns:
+        list or None: The command, or None if no player is available
+    """
+    if player == 'pw-play':
+        # PipeWire native - best for modern Pi OS
+        return ['pw-play', wav_file]
+    elif player == 'paplay':
+        # PulseAudio (or PipeWire compatibility), reads stdin without a file
+        return ['paplay'] if wav_file == '-' else ['paplay', wav_file]
+    elif player == 'ffplay':
+        # FFmpeg - good fallback, quiet mode
+        return ['ffplay', '-nodisp', '-autoexit', '-loglevel', 'quiet', wav_file]
+    elif player == 'aplay':
+        # ALSA direct, reads stdin without a file
+        return ['aplay', '-q'] if wav_file == '-' else ['aplay', '-q', wav_file]
+    return None
+
+
+def _speech_timeout(text):
+    """Seconds to allow a command that both synthesizes and plays text."""
+    return _PROCESS_TIMEOUT + len(text) * _MAX_SECONDS_PER_CHAR + _PLAYBACK_MARGIN
+
+
 def _play_wav(wav_file):
-    """Play a WAV file through the system default audio output."""
-    player = _get_audio_player()
+    """
+    Play a WAV file through the system default audio output.
+    
+    Returns:
+        bool: True if the player ran and exited cleanly
+    """
+    cmd = _player_command(_get_audio_player(), wav_file)
+    # No limit if the length can't be read (the player would likely fail)
+    duration = _wav_duration(wav_file)
+    timeout = duration + _PLAYBACK_MARGIN if duration is not None else None
     
     try:
-        if player == 'pw-play':
-            # PipeWire native - best for modern Pi OS
-            subprocess.run(['pw-play', wav_file], check=False)
-        elif player == 'paplay':
-            # PulseAudio (or PipeWire compatibility)
-            subprocess.run(['paplay', wav_file], check=False)
-        elif player == 'ffplay':
-            # FFmpeg - good fallback, quiet mode
-            subprocess.run(['ffplay', '-nodisp', '-autoexit', '-loglevel', 'quiet', wav_file], check=False)
-        elif player == 'aplay':
-            # ALSA direct
-            subprocess.run(['aplay', '-q', wav_file], check=False)
-        else:
-            print("⚠️  No audio player available")
-            print("   Install one of: pipewire, pulseaudio, ffmpeg")
+        if cmd:
+            return _run(cmd, timeout) == 0
+        print("⚠️  No audio player available")
+        print("   Install one of: pipewire, pulseaudio, ffmpeg")
     except Exception as e:
         print(f"⚠️  Audio playback error: {e}")
+    return False
+
+
+def _pipe_to_player(producer_cmd, timeout):
+    """
+    Run a command that writes WAV data to stdout, streaming it straight
+    into the audio player (no intermediate file).
+    
+    Args:
+        producer_cmd: Command line that writes a WAV stream to stdout
+        timeout: Seconds after which both are killed as wedged
+        
+    Returns:
+        bool: True if both the producer and the player exited cleanly
+    """
+    cmd = _player_command(_get_audio_player())
+    if not cmd:
+        print("⚠️  No audio player available")
+        print("   Install one of: pipewire, pulseaudio, ffmpeg")
+        return False
+    
+    try:
+        # Cached absolute paths, so exec doesn't search PATH per utterance
+        producer = subprocess.Popen(producer_cmd, executable=_which(producer_cmd[0]),
+                                    stdout=subprocess.PIPE)
+        player = subprocess.Popen(cmd, executable=_which(cmd[0]), stdin=producer.stdout)
+        # Only the player should hold the read end, so it sees EOF
+        producer.stdout.close()
+        try:
+            # The producer is done by the time the player has read it all
+            return (player.wait(timeout) == 0
+                    and producer.wait(_PROCESS_TIMEOUT) == 0)
+        except subprocess.TimeoutExpired:
+            producer.kill()
+            player.kill()
+            producer.wait()
+            player.wait()
+            return False
+    except Exception as e:
+        print(f"⚠️  Audio playback error: {e}")
+        return False
 
 
 def check_tts_available():
@@ -68,22 +264,218 @@ def check_tts_available():
     Returns:
         str or None: 'pico2wave', 'espeak', 'say', or None
     """
-    if shutil.which('pico2wave'):
-        return 'pico2wave'
-    elif shutil.which('espeak'):
-        return 'espeak'
-    elif shutil.which('say'):
-        return 'say'
+    for engine in _TTS_ENGINES:
+        if _which(engine):
+            return engine
     return None
 
 
-def init_tts():
-    """Initialize TTS and return the available engine."""
+def _render_wav(text, wav_file, tts_cmd):
+    """
+    Synthesize text into a WAV file (same voice and volume as speaking it).
+    
+    Args:
+        text: The text to synthesize
+        wav_file: Path of the WAV file to write
+        tts_cmd: 'pico2wave' or 'espeak'
+        
+    Returns:
+        bool: True if the WAV file was written
+    """
+    if tts_cmd == 'pico2wave':
+        _run(['pico2wave', '-l', 'en-US', '-w', wav_file, text])
+        if _which('sox') and os.path.exists(wav_file):
+            amplified_file = wav_file + '_loud.wav'
+            if _run(['sox', wav_file, amplified_file, 'vol', '3.0']) == 0:
+                os.replace(amplified_file, wav_file)
+            elif os.path.exists(amplified_file):
+                os.remove(amplified_file)  # Keep the unboosted render
+    elif tts_cmd == 'espeak':
+        _run(['espeak', *_ESPEAK_ARGS, '-w', wav_file, text])
+    else:
+        return False
+    return os.path.exists(wav_file) and os.path.getsize(wav_file) > 0
+
+
+def _trim_wav_cache():
+    """Delete the least recently used cached WAVs beyond _WAV_CACHE_MAX."""
+    try:
+        paths = [entry.path for entry in os.scandir(_WAV_CACHE_DIR)]
+        if len(paths) <= _WAV_CACHE_MAX:
+            return
+        paths.sort(key=os.path.getmtime)
+        for path in paths[:-_WAV_CACHE_MAX]:
+            os.remove(path)
+    except OSError:
+        pass  # Another process got there first; trim again next time
+
+
+def _is_own(st):
+    """True if a stat result belongs to this user and no one else can write it."""
+    return st.st_uid == os.getuid() and not st.st_mode & 0o022
+
+
+def _wav_cache_usable():
+    """
+    Create the WAV cache directory if needed.
+    
+    Returns:
+        bool: True if the directory is this user's alone (if someone else
+        made it first, its contents can't be trusted)
+    """
+    try:
+        os.makedirs(_WAV_CACHE_DIR, mode=0o700, exist_ok=True)
+        st = os.lstat(_WAV_CACHE_DIR)
+    except OSError:
+        return False
+    return stat.S_ISDIR(st.st_mode) and _is_own(st) and not st.st_mode & 0o077
+
+
+def _cached_wav(text, tts_cmd):
+    """
+    Get a rendered WAV of text from the cache, rendering it on a miss.
+    Only call this once _wav_cache_usable() has said the cache is ours.
+    
+    Args:
+        text: The text to synthesize
+        tts_cmd: 'pico2wave' or 'espeak'
+        
+    Returns:
+        str or None: Path of the WAV file, or None if rendering failed
+    """
+    key = hashlib.blake2b(f'{tts_cmd}\0{text}'.encode(), digest_size=8).hexdigest()
+    wav_file = os.path.join(_WAV_CACHE_DIR, f'{key}.wav')
+    try:
+        st = os.lstat(wav_file)
+        if stat.S_ISREG(st.st_mode) and _is_own(st):
+            os.utime(wav_file)  # Hit: mark it recently used
+            return wav_file
+    except OSError:
+        pass
+    
+    # Render beside it and rename, so no one plays a half-written file
+    # (pico2wave insists on a .wav extension)
+    tmp_file = os.path.join(_WAV_CACHE_DIR, f'{key}.{os.getpid()}.tmp.wav')
+    try:
+        if not _render_wav(text, tmp_file, tts_cmd):
+            return None
+        os.replace(tmp_file, wav_file)
+    finally:
+        if os.path.exists(tmp_file):
+            os.remove(tmp_file)  # The render failed part way
+    _trim_wav_cache()
+    return wav_file
+
+
+def _render_temp_wav(text, tts_cmd):
+    """
+    Render text into a new private temporary WAV file.
+    
+    Returns:
+        str or None: Path of the WAV file (the caller removes it), or None
+        if rendering failed
+    """
+    fd, wav_file = tempfile.mkstemp(prefix='bbb_', suffix='.wav', dir=_TMP_DIR)
+    os.close(fd)
+    ok = False
+    try:
+        ok = _render_wav(text, wav_file, tts_cmd)
+    finally:
+        if not ok:
+            os.remove(wav_file)
+    return wav_file if ok else None
+
+
+def _remove_laugh_wav():
+    """Delete this process's pre-rendered laugh, if any."""
+    global _laugh_wav
+    if _laugh_wav:
+        try:
+            os.remove(_laugh_wav)
+        except OSError:
+            pass
+    _laugh_wav = None
+
+
+def _prerender_laugh(tts_cmd):
+    """
+    Render the laugh line once so each laugh is just a WAV playback. Each
+    process renders its own file, so starting the CLI can't rewrite the
+    laugh the web server is playing.
+    """
+    global _laugh_wav
+    _remove_laugh_wav()
+    if not _get_audio_player():
+        return
+    
+    try:
+        _laugh_wav = _render_temp_wav(LAUGH_TEXT, tts_cmd)
+    except Exception as e:
+        print(f"⚠️  Could not pre-render laugh: {e}")
+    if _laugh_wav:
+        atexit.register(_remove_laugh_wav)
+
+
+def _start_espeak_server():
+    """Start a long-running espeak that speaks each line written to its stdin."""
+    global _espeak_proc, _espeak_player
+    player = _get_audio_player()
+    
+    # No text argument and no --stdin: espeak then speaks stdin a line at a
+    # time as it arrives (--stdin would read it all, up to EOF, first)
+    try:
+        if player in ['pw-play', 'paplay', 'ffplay']:
+            _espeak_proc = subprocess.Popen(['espeak', *_ESPEAK_ARGS, '--stdout'],
+                                            stdin=subprocess.PIPE, stdout=subprocess.PIPE)
+            _espeak_player = subprocess.Popen(_player_command(player), stdin=_espeak_proc.stdout)
+            _espeak_proc.stdout.close()
+        else:
+            _espeak_proc = subprocess.Popen(['espeak', *_ESPEAK_ARGS],
+                                            stdin=subprocess.PIPE)
+        atexit.register(_stop_espeak_server)
+    except Exception as e:
+        _espeak_proc = None
+        _espeak_player = None
+        print(f"⚠️  Could not start espeak: {e}")
+
+
+def _stop_espeak_server():
+    """Let the running espeak finish what it has queued, then exit."""
+    global _espeak_proc, _espeak_player
+    if _espeak_proc:
+        try:
+            _espeak_proc.stdin.close()
+            _espeak_proc.wait()
+            if _espeak_player:
+                _espeak_player.wait()
+        except Exception:
+            pass
+    _espeak_proc = None
+    _espeak_player = None
+
+
+def init_tts(persistent=False):
+    """
+    Initialize TTS and return the available engine.
+    
+    Args:
+        persistent: If True and the engine is espeak, keep one espeak process
+            running and queue utterances to it instead of starting espeak per
+            utterance. Speech calls then return without waiting for playback.
+    """
     global _tts_command
     _tts_command = check_tts_available()
     audio_player = _get_audio_player()
+    _which('sox')  # Resolve now rather than on the first utterance
     
     if _tts_command:
+        if persistent and _tts_command == 'espeak':
+            _start_espeak_server()
+        # A running espeak speaks the laugh in order with everything else.
+        # Otherwise render it on the TTS worker, so startup doesn't wait for
+        # it and queued speak_text_async laughs run after it's ready
+        if not _espeak_proc:
+            _tts_executor.submit(_prerender_laugh, _tts_command)
         print(f"🔊 TTS initialized: {_tts_command}")
         if audio_player == 'pw-play':
             print("🔊 Audio output: PipeWire (system default)")
@@ -95,6 +487,8 @@ def init_tts():
             print("🔊 Audio output: ALSA (may need configuration)")
         else:
             print("⚠️  No audio player found!")
+        if _espeak_proc:
+            print("🔊 espeak kept running for instant speech")
     else:
         print("⚠️  No TTS available (install: sudo apt install libttspico-utils espeak)")
     return _tts_command
@@ -110,74 +504,135 @@ def get_tts_lock():
     return _tts_lock
 
 
-def speak_with_pico(text):
+def get_tts_error():
+    """Get the reason the last utterance failed, if it did."""
+    return _tts_error
+
+
+def is_speech_queued():
+    """
+    True if speech goes to the running espeak (see init_tts), so speaking
+    only queues the line: it returns before playback, and on_start
+    callbacks aren't called since when the line plays isn't known.
+    """
+    return _espeak_proc is not None and _espeak_proc.poll() is None
+
+
+def speak_with_pico(text, on_start=None):
     """
     Speak using pico2wave (more natural voice) with volume boost.
     
     Args:
         text: The text to speak
+        on_start: Optional callback, called with the audio length in seconds
+            just before playback starts
+            
+    Returns:
+        bool: True if the speech was synthesized and played
     """
-    with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as f:
-        wav_file = f.name
-    
-    subprocess.run(['pico2wave', '-l', 'en-US', '-w', wav_file, text], check=False)
-    
-    # Amplify with sox if available (boost volume 3x)
-    if shutil.which('sox'):
-        amplified_file = wav_file + '_loud.wav'
-        subprocess.run(['sox', wav_file, amplified_file, 'vol', '3.0'], check=False)
-        _play_wav(amplified_file)
-        try:
-            os.unlink(amplified_file)
-        except:
-            pass
-    else:
-        _play_wav(wav_file)
+    # Rendered (and boosted 3x with sox, if available) once per line
+    if _wav_cache_usable():
+        wav_file = _cached_wav(text, 'pico2wave')
+        if not wav_file:
+            return False
+        _notify_start(on_start, _wav_duration(wav_file))
+        return _play_wav(wav_file)
     
+    # No cache directory of our own: render this line just for now
+    wav_file = _render_temp_wav(text, 'pico2wave')
+    if not wav_file:
+        return False
     try:
-        os.unlink(wav_file)
-    except:
-        pass
+        _notify_start(on_start, _wav_duration(wav_file))
+        return _play_wav(wav_file)
+    finally:
+        os.remove(wav_file)
 
 
-def speak_with_espeak(text):
+def speak_with_espeak(text, on_start=None):
     """
     Speak using espeak.
     
     Args:
         text: The text to speak
+        on_start: Optional callback, called (with None, as the length isn't
+            known up front) just before playback starts; not called when
+            the line is only queued on the running espeak
+            
+    Returns:
+        bool: True if the speech played (or was queued on the running espeak)
     """
+    if is_speech_queued():
+        # Queue the line on the running espeak (one line = one utterance)
+        _espeak_proc.stdin.write((' '.join(text.split()) + '\n').encode())
+        _espeak_proc.stdin.flush()
+        return True
+    
+    _notify_start(on_start)
+    
     player = _get_audio_player()
     
-    # Output to WAV and play through system audio player
+    # Stream WAV output through system audio player
     # This ensures audio goes to system default output
     if player in ['pw-play', 'paplay', 'ffplay']:
-        with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as f:
-            wav_file = f.name
-        # -a 200 = max volume, -s 100 = slow speed, -g 15 = longer gaps between words
-        # -w outputs to WAV file instead of playing directly
-        subprocess.run(['espeak', '-a', '200', '-s', '100', '-g', '15', '-w', wav_file, text], check=False)
-        _play_wav(wav_file)
-        try:
-            os.unlink(wav_file)
-        except:
-            pass
-    else:
-        # Fall back to direct espeak output
-        subprocess.run(['espeak', '-a', '200', '-s', '100', '-g', '15', text], check=False)
+        # --stdout writes the WAV stream to stdout instead of playing directly
+        return _pipe_to_player(['espeak', *_ESPEAK_ARGS, '--stdout', text],
+                               _speech_timeout(text))
+    # Fall back to direct espeak output
+    return _run(['espeak', *_ESPEAK_ARGS, text], _speech_timeout(text)) == 0
 
 
-def speak_with_say(text):
+def speak_with_say(text, on_start=None):
     """
     Speak using macOS 'say' command.
     
     Args:
         text: The text to speak
+        on_start: Optional callback, called (with None, as the length isn't
+            known up front) just before playback starts
+            
+    Returns:
+        bool: True if say exited cleanly
     """
-    subprocess.run(['say', '-v', 'Fred', text], check=False)
+    _notify_start(on_start)
+    return _run(['say', '-v', 'Fred', text], _speech_timeout(text)) == 0
+
+
+# The speak function for each engine in _TTS_ENGINES
+_SPEAKERS = {
+    'pico2wave': speak_with_pico,
+    'espeak': speak_with_espeak,
+    'say': speak_with_say,
+}
+
+
+def _speak(text, is_laugh, tts_cmd, on_start):
+    """Speak text with the given engine (see speak_text_sync)."""
+    global _tts_error
+    
+    with _tts_lock:
+        ok = False
+        try:
+            if is_laugh:
+                # Pre-rendered by init_tts for the active engine
+                if _laugh_wav and tts_cmd == _tts_command:
+                    _notify_start(on_start, _wav_duration(_laugh_wav))
+                    ok = _play_wav(_laugh_wav)
+                    _tts_error = None if ok else "Audio playback failed"
+                    return ok
+                text = LAUGH_TEXT
+            
+            speaker = _SPEAKERS.get(tts_cmd)
+            if speaker:
+                ok = speaker(text, on_start)
+            _tts_error = None if ok else f"{tts_cmd} failed"
+        except Exception as e:
+            print(f"TTS error: {e}")
+            _tts_error = str(e)
+        return ok
 
 
-def speak_text_sync(text, is_laugh=False, tts_cmd=None):
+def speak_text_sync(text, is_laugh=False, tts_cmd=None, on_start=None, animate=False):
     """
     Speak text using system TTS (blocking).
     
@@ -185,41 +640,65 @@ def speak_text_sync(text, is_laugh=False, tts_cmd=None):
         text: The text to speak
         is_laugh: If True, speak the laugh text instead
         tts_cmd: TTS command to use (auto-detected if None)
+        on_start: Optional callback, called just before playback starts with
+            the audio length in seconds (None when the engine can't tell);
+            not called when speech is only queued (see is_speech_queued)
+        animate: If True, move the hand (see bbb.servo.init_servo) along
+            with the speech: talking, or a slap for the laugh
+            
+    Returns:
+        bool: True if the text was spoken, False if no engine is available
+        or it failed (the reason is then available from get_tts_error)
     """
+    global _tts_error
+    
     if tts_cmd is None:
         tts_cmd = _tts_command or check_tts_available()
     
     if not tts_cmd:
-        return
+        _tts_error = "No TTS engine available"
+        return False
     
-    with _tts_lock:
-        try:
-            if is_laugh:
-                text = "Ha ha ha ha! That's a good one!"
-            
-            if tts_cmd == 'pico2wave':
-                speak_with_pico(text)
-            elif tts_cmd == 'espeak':
-                speak_with_espeak(text)
-            elif tts_cmd == 'say':
-                speak_with_say(text)
-        except Exception as e:
-            print(f"TTS error: {e}")
+    if not animate:
+        return _speak(text, is_laugh, tts_cmd, on_start)
+    
+    from bbb.servo import hand_talking_animation, hand_slap_animation, start_animation
+    
+    animation = None
+    speech_done = threading.Event()
+    
+    def start_moving(duration):
+        # Runs right before playback, with the real audio length when known;
+        # otherwise the hand keeps moving until the speech has finished
+        nonlocal animation
+        _notify_start(on_start, duration)
+        if is_laugh:
+            animation = start_animation(hand_slap_animation, True)
+        else:
+            animation = start_animation(hand_talking_animation, duration, True,
+                                        stop=speech_done)
+    
+    try:
+        return _speak(text, is_laugh, tts_cmd, start_moving)
+    finally:
+        speech_done.set()
+        if animation:
+            animation.result()
 
 
-def speak_text_async(text, is_laugh=False, tts_cmd=None):
+def speak_text_async(text, is_laugh=False, tts_cmd=None, on_start=None):
     """
-    Speak text in a background thread.
+    Speak text on the background TTS worker thread. Utterances are spoken
+    one after another, in the order they were queued.
     
     Args:
         text: The text to speak
         is_laugh: If True, speak the laugh text instead
         tts_cmd: TTS command to use (auto-detected if None)
+        on_start: Optional callback, as for speak_text_sync (called on the
+            TTS worker thread)
         
     Returns:
-        threading.Thread: The thread running the speech
+        concurrent.futures.Future: Resolves to speak_text_sync's result
     """
-    thread = threading.Thread(target=speak_text_sync, args=(text, is_laugh, tts_cmd))
-    thread.start()
-    return thread
-
+    return _tts_executor.submit(speak_text_sync, text, is_laugh, tts_cmd, on_start)
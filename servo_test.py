@@ -4,7 +4,9 @@ Servo Test Script for Raspberry Pi 5
 =====================================
 For: HobbyPark 25KG Servo (180° control angle)
 
-Uses gpiozero with lgpio backend for Pi 5 compatibility.
+Drives the pin through bbb.servo.ServoController, which uses the first
+backend that works: hardware PWM (rpi-hardware-pwm), then lgpio's servo
+pulses, then gpiozero.
 Includes jitter mitigation by releasing servo after movement.
 
 WIRING:
@@ -25,6 +27,11 @@ SETUP (Raspberry Pi 5):
 sudo apt update
 sudo apt install python3-gpiozero python3-lgpio
 
+# Optional, for jitter-free hardware PWM on GPIO 18:
+pip install rpi-hardware-pwm
+# ...and add to /boot/firmware/config.txt, then reboot:
+#   dtoverlay=pwm-2chan
+
 # Run this script:
 python3 servo_test.py
 
@@ -36,114 +43,73 @@ Software PWM on Pi can cause jitter. This script mitigates it by:
 3. Option to use a PCA9685 servo driver board (recommended for production)
 """
 
+import os
 import sys
 import time
-import os
 
-# Set lgpio as the pin factory before importing gpiozero
-os.environ['GPIOZERO_PIN_FACTORY'] = 'lgpio'
+# Get the directory where this script lives
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 
-try:
-    from gpiozero import PWMOutputDevice
-except ImportError:
-    print("Error: gpiozero not installed!")
-    print("Run: sudo apt install python3-gpiozero python3-lgpio")
-    sys.exit(1)
+# Add lib to path for imports
+sys.path.insert(0, SCRIPT_DIR)
+
+from bbb.servo import ServoController, play_steps
 
 # Configuration
 GPIO_PIN = 18  # GPIO 18 = Physical Pin 12
 
-# Servo pulse width calibration
-# Standard servo: 0.5ms - 2.5ms pulse for 180° range
-# PWM frequency is 50Hz (20ms period), so duty cycle:
-#   0° = 0.5ms / 20ms = 0.025 (2.5%)
-#   180° = 2.5ms / 20ms = 0.125 (12.5%)
-MIN_DUTY = 0.025   # Duty cycle for 0° (adjust if needed)
-MAX_DUTY = 0.125   # Duty cycle for 180° (adjust if needed)
+# Servo pulse width calibration, passed to ServoController as min_pulse_us
+# and max_pulse_us (standard servo: 0.5ms - 2.5ms pulse for 180° range).
+# lgpio takes the pulse widths as they are; for hardware PWM and gpiozero
+# they're turned into duty cycles at PWM_FREQ
+MIN_PULSE_US = 500    # Pulse width for 0° in microseconds (adjust if needed)
+MAX_PULSE_US = 2500   # Pulse width for 180° in microseconds (adjust if needed)
 PWM_FREQ = 50      # Standard servo frequency (Hz)
 
 # Jitter mitigation settings
 SETTLE_TIME = 0.3      # Time to let servo reach position before releasing
 AUTO_RELEASE = True    # Release servo after movement to prevent jitter
 
+# Sweep as (angle, seconds to hold) steps: 0° → 180° in 10° steps, a
+# pause at the top, then back down to 0°
+SWEEP_STEPS = (
+    tuple((angle, 0.1) for angle in range(0, 180, 10))
+    + ((180, 0.5),)
+    + tuple((angle, 0.1) for angle in range(170, -1, -10))
+)
 
-class ServoController:
-    """PWM-based servo controller with jitter mitigation for Pi 5."""
-    
-    def __init__(self, gpio_pin, min_duty=0.025, max_duty=0.125, freq=50):
-        self.gpio = gpio_pin
-        self.min_duty = min_duty
-        self.max_duty = max_duty
-        self.freq = freq
-        self.current_angle = None
-        self.pwm = None
-        self._init_pwm()
-    
-    def _init_pwm(self):
-        """Initialize PWM output."""
-        try:
-            self.pwm = PWMOutputDevice(
-                self.gpio,
-                frequency=self.freq,
-                initial_value=0
-            )
-        except Exception as e:
-            print(f"Error initializing PWM: {e}")
-            print("\nTroubleshooting:")
-            print("1. Make sure lgpio is installed: sudo apt install python3-lgpio")
-            print("2. Check that GPIO pin is not in use")
-            print("3. Try running with sudo if permission denied")
-            sys.exit(1)
-    
-    def angle_to_duty(self, angle):
-        """Convert angle (0-180) to duty cycle."""
-        angle = max(0, min(180, angle))
-        duty_range = self.max_duty - self.min_duty
-        return self.min_duty + (angle / 180.0) * duty_range
-    
-    def set_angle(self, angle, hold=False):
-        """
-        Move servo to specified angle (0-180 degrees).
-        
-        Args:
-            angle: Target angle (0-180)
-            hold: If True, keep PWM signal active (may cause jitter)
-        """
-        angle = max(0, min(180, angle))
-        duty = self.angle_to_duty(angle)
-        
-        self.pwm.value = duty
-        self.current_angle = angle
-        
-        # Wait for servo to reach position
-        time.sleep(SETTLE_TIME)
-        
-        # Release to prevent jitter (unless hold is requested)
-        if AUTO_RELEASE and not hold:
-            self.release()
-    
-    def set_angle_quick(self, angle):
-        """Set angle without waiting or releasing (for sweeps)."""
-        angle = max(0, min(180, angle))
-        duty = self.angle_to_duty(angle)
-        self.pwm.value = duty
-        self.current_angle = angle
-    
-    def release(self):
-        """Stop PWM signal (servo won't hold position but won't jitter)."""
-        self.pwm.value = 0
+# Relative moves shared by interactive and calibration mode (degrees)
+STEP_COMMANDS = {'+': 5, '++': 10, '-': -5, '--': -10}
+
+
+def move_to(servo, angle, hold=False):
+    """
+    Move servo to angle, releasing it once it has settled unless holding.
     
-    def hold(self):
-        """Re-engage servo at current angle."""
-        if self.current_angle is not None:
-            duty = self.angle_to_duty(self.current_angle)
-            self.pwm.value = duty
+    Args:
+        servo: ServoController instance
+        angle: Target angle (0-180)
+        hold: If True, keep PWM signal active (may cause jitter)
+    """
+    if hold or not AUTO_RELEASE:
+        servo.set_angle_blocking(angle, SETTLE_TIME, hold=True)
+    else:
+        # Released from a timer, so the prompt comes back right away
+        servo.set_angle_and_release(angle, SETTLE_TIME)
+
+
+def nudge(servo, current, delta):
+    """
+    Move the servo by delta degrees from current, staying within 0-180.
     
-    def cleanup(self):
-        """Release resources."""
-        if self.pwm:
-            self.pwm.value = 0
-            self.pwm.close()
+    Returns:
+        int: The new angle
+    """
+    move_to(servo, current + delta)
+    # set_angle clamps to 0-180; read back where it actually went
+    current = servo.current_angle
+    print(f"  → {current}°")
+    return current
 
 
 def sweep_test(servo):
@@ -151,21 +117,12 @@ def sweep_test(servo):
     print("\n🔄 Sweep Test: 0° → 180° → 0°")
     print("-" * 30)
     
-    # Sweep from 0 to 180
-    for angle in range(0, 181, 10):
-        servo.set_angle_quick(angle)
-        print(f"  → {angle}°")
-        time.sleep(0.1)
-    
-    time.sleep(0.3)
+    # One write for the whole listing, kept out of the timed steps
+    sys.stdout.write(''.join(f"  → {angle}°\n" for angle, _ in SWEEP_STEPS))
+    sys.stdout.flush()
     
-    # Sweep from 180 to 0
-    for angle in range(180, -1, -10):
-        servo.set_angle_quick(angle)
-        print(f"  → {angle}°")
-        time.sleep(0.1)
-    
-    servo.release()
+    # Queued to lgpio when it can be, otherwise paced step by step
+    play_steps(servo, SWEEP_STEPS)
     print("✓ Sweep complete! (servo released)")
 
 
@@ -178,7 +135,7 @@ def position_test(servo):
     
     for pos in positions:
         print(f"\nMoving to {pos}°...")
-        servo.set_angle(pos, hold=True)  # Hold during test
+        move_to(servo, pos, hold=True)  # Hold during test
         time.sleep(0.7)
     
     servo.release()
@@ -215,7 +172,7 @@ def calibration_mode(servo):
     
     # Start at center
     print(f"\nStarting at {current}°...")
-    servo.set_angle(current)
+    move_to(servo, current)
     
     while True:
         try:
@@ -262,32 +219,15 @@ def calibration_mode(servo):
                 open_pos = current
                 print(f"  ✓ Marked {current}° as MOUTH OPEN")
             
-            elif cmd == '+':
-                current = min(180, current + 5)
-                servo.set_angle(current)
-                print(f"  → {current}°")
-            
-            elif cmd == '++':
-                current = min(180, current + 10)
-                servo.set_angle(current)
-                print(f"  → {current}°")
-            
-            elif cmd == '-':
-                current = max(0, current - 5)
-                servo.set_angle(current)
-                print(f"  → {current}°")
-            
-            elif cmd == '--':
-                current = max(0, current - 10)
-                servo.set_angle(current)
-                print(f"  → {current}°")
+            elif cmd in STEP_COMMANDS:
+                current = nudge(servo, current, STEP_COMMANDS[cmd])
             
             else:
                 try:
                     angle = int(cmd)
                     if 0 <= angle <= 180:
                         current = angle
-                        servo.set_angle(current)
+                        move_to(servo, current)
                         print(f"  → {current}°")
                     else:
                         print("  ⚠ Angle must be 0-180")
@@ -299,6 +239,50 @@ def calibration_mode(servo):
             return None, None
 
 
+def _goto(servo, angle):
+    """Move to an absolute angle, reporting progress. Returns the angle."""
+    print(f"  → Moving to {angle}°...")
+    move_to(servo, angle)
+    print("  → Done (released)")
+    return angle
+
+
+def _sweep_command(servo, current_angle):
+    sweep_test(servo)
+    return 0
+
+
+def _calibrate_command(servo, current_angle):
+    calibration_mode(servo)
+    return 90
+
+
+def _hold_command(servo, current_angle):
+    servo.hold()
+    print("  → Servo engaged (holding position)")
+    print("    ⚠️  May jitter - type 'release' to stop")
+    return current_angle
+
+
+def _release_command(servo, current_angle):
+    servo.release()
+    print("  → Servo released")
+    return current_angle
+
+
+# Interactive mode commands: handler(servo, current_angle) -> new angle
+INTERACTIVE_COMMANDS = {
+    'sweep': _sweep_command,
+    'calibrate': _calibrate_command,
+    'cal': _calibrate_command,
+    'center': lambda servo, current_angle: _goto(servo, 90),
+    'min': lambda servo, current_angle: _goto(servo, 0),
+    'max': lambda servo, current_angle: _goto(servo, 180),
+    'hold': _hold_command,
+    'release': _release_command,
+}
+
+
 def interactive_mode(servo):
     """Interactive mode for manual servo control."""
     print("\n🎮 Interactive Mode")
@@ -328,58 +312,17 @@ def interactive_mode(servo):
             
             if cmd == 'quit' or cmd == 'q':
                 break
-            elif cmd == 'sweep':
-                sweep_test(servo)
-                current_angle = 0
-            elif cmd == 'calibrate' or cmd == 'cal':
-                calibration_mode(servo)
-                current_angle = 90
-            elif cmd == 'center':
-                current_angle = 90
-                print(f"  → Moving to {current_angle}°...")
-                servo.set_angle(current_angle)
-                print("  → Done (released)")
-            elif cmd == 'min':
-                current_angle = 0
-                print(f"  → Moving to {current_angle}°...")
-                servo.set_angle(current_angle)
-                print("  → Done (released)")
-            elif cmd == 'max':
-                current_angle = 180
-                print(f"  → Moving to {current_angle}°...")
-                servo.set_angle(current_angle)
-                print("  → Done (released)")
-            elif cmd == '+':
-                current_angle = min(180, current_angle + 5)
-                servo.set_angle(current_angle)
-                print(f"  → {current_angle}°")
-            elif cmd == '++':
-                current_angle = min(180, current_angle + 10)
-                servo.set_angle(current_angle)
-                print(f"  → {current_angle}°")
-            elif cmd == '-':
-                current_angle = max(0, current_angle - 5)
-                servo.set_angle(current_angle)
-                print(f"  → {current_angle}°")
-            elif cmd == '--':
-                current_angle = max(0, current_angle - 10)
-                servo.set_angle(current_angle)
-                print(f"  → {current_angle}°")
-            elif cmd == 'hold':
-                servo.hold()
-                print("  → Servo engaged (holding position)")
-                print("    ⚠️  May jitter - type 'release' to stop")
-            elif cmd == 'release':
-                servo.release()
-                print("  → Servo released")
+            
+            handler = INTERACTIVE_COMMANDS.get(cmd)
+            if handler:
+                current_angle = handler(servo, current_angle)
+            elif cmd in STEP_COMMANDS:
+                current_angle = nudge(servo, current_angle, STEP_COMMANDS[cmd])
             else:
                 try:
                     angle = int(cmd)
                     if 0 <= angle <= 180:
-                        current_angle = angle
-                        print(f"  → Moving to {current_angle}°...")
-                        servo.set_angle(current_angle)
-                        print("  → Done (released)")
+                        current_angle = _goto(servo, angle)
                     else:
                         print("  ⚠ Angle must be 0-180")
                 except ValueError:
@@ -394,7 +337,7 @@ def main():
     print("=" * 50)
     print("🤖 Servo Test for Raspberry Pi 5")
     print("   HobbyPark 25KG Servo (180°)")
-    print("   Using gpiozero + lgpio (Pi 5 compatible)")
+    print("   Using hardware PWM, lgpio or gpiozero (Pi 5 compatible)")
     print("=" * 50)
     print(f"\nUsing GPIO pin: {GPIO_PIN} (Physical pin 12)")
     print("\n⚠️  IMPORTANT: Use external power for the servo!")
@@ -402,13 +345,22 @@ def main():
     
     # Create servo controller
     print("Initializing servo...")
-    servo = ServoController(GPIO_PIN, MIN_DUTY, MAX_DUTY, PWM_FREQ)
+    try:
+        servo = ServoController(GPIO_PIN, MIN_PULSE_US, MAX_PULSE_US, PWM_FREQ)
+    except Exception as e:
+        print(f"Error initializing PWM: {e}")
+        print("\nTroubleshooting:")
+        print("1. Make sure lgpio is installed: sudo apt install python3-lgpio")
+        print("   (or rpi-hardware-pwm with dtoverlay=pwm-2chan)")
+        print("2. Check that GPIO pin is not in use")
+        print("3. Try running with sudo if permission denied")
+        sys.exit(1)
     print("✓ Servo initialized!\n")
     
     try:
         # Center the servo first
         print("Centering servo (90°)...")
-        servo.set_angle(90)
+        move_to(servo, 90)
         print("✓ Centered (released to prevent jitter)\n")
         time.sleep(0.5)
         
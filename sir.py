@@ -1,10 +1,11 @@
 #!/usr/bin/env python3
 
-import json
+# Only what every run needs is imported up front (time is loaded by
+# bbb.servo anyway); the joke index, RNG and TTS modules are imported
+# where they're used, so e.g. a silent joke doesn't load the TTS module
+# and the usage banner doesn't load the jokes
 import os
-import random
 import sys
-import threading
 import time
 
 # Get the directory where this script lives
@@ -14,100 +15,67 @@ SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 sys.path.insert(0, SCRIPT_DIR)
 
 from bbb.servo import (
+    NullServo,
     init_servo,
     get_servo,
     move_mouth,
-    mouth_talking_animation,
-    laugh_animation,
     MOUTH_CLOSED,
 )
-from bbb.tts import (
-    check_tts_available,
-    speak_text_sync,
-)
 
-# Initialize servo
+# Initialize servo (a no-op NullServo if there isn't one, so calls on it
+# needn't be guarded; it's falsy, so `if servo:` still checks for one)
 servo, servo_error = init_servo()
+servo = servo or NullServo()
 
 
 def load_jokes():
+    from bbb.jokes import JokeIndex
     try:
-        jokes_path = os.path.join(SCRIPT_DIR, 'dad_jokes.json')
-        with open(jokes_path, 'r') as f:
-            data = json.load(f)
-            return data['jokes']
+        return JokeIndex()
     except FileNotFoundError:
         print("Error: dad_jokes.json file not found!")
         sys.exit(1)
-    except json.JSONDecodeError:
+    except ValueError:
+        # JSONDecodeError, or no "jokes" array (or an empty file to map)
         print("Error: Invalid JSON format in dad_jokes.json!")
         sys.exit(1)
 
 
 def get_random_joke(jokes):
-    return random.choice(jokes)
-
-
-def speak_text(text, tts_cmd=None, is_laugh=False):
-    """Speak text with synchronized mouth movement."""
-    if tts_cmd == 'pico2wave' or tts_cmd == 'espeak':
-        if is_laugh:
-            if servo:
-                animation_thread = threading.Thread(target=laugh_animation)
-                animation_thread.start()
-            speak_text_sync("", is_laugh=True, tts_cmd=tts_cmd)
-            if servo:
-                animation_thread.join()
-        else:
-            if servo:
-                duration = max(1.0, len(text) / 8)
-                animation_thread = threading.Thread(target=mouth_talking_animation, args=(duration,))
-                animation_thread.start()
-            speak_text_sync(text, tts_cmd=tts_cmd)
-            if servo:
-                animation_thread.join()
-                
-    elif tts_cmd == 'say':
-        if is_laugh:
-            if servo:
-                animation_thread = threading.Thread(target=laugh_animation)
-                animation_thread.start()
-            speak_text_sync("", is_laugh=True, tts_cmd=tts_cmd)
-            if servo:
-                animation_thread.join()
-        else:
-            if servo:
-                duration = max(1.0, len(text) / 10)
-                animation_thread = threading.Thread(target=mouth_talking_animation, args=(duration,))
-                animation_thread.start()
-            speak_text_sync(text, tts_cmd=tts_cmd)
-            if servo:
-                animation_thread.join()
+    import random
+    return jokes[random.randrange(len(jokes))]
 
 
-def tell_joke(joke, use_speech=False):
-    tts_cmd = check_tts_available() if use_speech else None
-    
+def tell_joke(joke, tts_cmd=None):
+    """Tell a joke, speaking it with tts_cmd if given."""
     # Close mouth at start
     if servo:
         move_mouth(MOUTH_CLOSED)
         time.sleep(0.2)
     
     print(f"\n{joke['setup']}")
-    if use_speech and tts_cmd:
-        speak_text(joke['setup'], tts_cmd)
+    if tts_cmd:
+        from bbb.tts import speak_text_sync
+        speak_text_sync(joke['setup'], tts_cmd=tts_cmd, animate=bool(servo))
     
     # Release servo while waiting for input
-    if servo:
-        servo.release()
+    servo.release()
     
     input("Press Enter for the punchline...")
     
     print(f"{joke['punchline']}\n")
-    if use_speech and tts_cmd:
-        speak_text(joke['punchline'], tts_cmd)
-        time.sleep(0.5)
-        speak_text("", tts_cmd, is_laugh=True)
+    if tts_cmd == 'say':
+        from bbb.tts import LAUGH_TEXT, speak_text_sync
+        # say can pause mid-utterance ([[slnc ms]]), so one process speaks
+        # both (say is macOS-only, so there's no servo laugh to sync with)
+        speak_text_sync(f"{joke['punchline']} [[slnc 500]] {LAUGH_TEXT}", tts_cmd=tts_cmd)
+    elif tts_cmd:
+        from bbb.tts import speak_text_sync
+        # No point pausing for a laugh if the punchline didn't play; the
+        # laugh itself is pre-rendered by init_tts, so it's just a playback
+        if speak_text_sync(joke['punchline'], tts_cmd=tts_cmd, animate=bool(servo)):
+            time.sleep(0.5)
+            speak_text_sync("", is_laugh=True, tts_cmd=tts_cmd, animate=bool(servo))
     
     # Make sure servo is released at the end
     if servo:
@@ -119,10 +87,15 @@ def main():
     if len(sys.argv) > 1 and sys.argv[1].lower() in ['joke', 'tell', 'j']:
         use_speech = '--speak' in sys.argv or '-s' in sys.argv
         
-        if use_speech and not check_tts_available():
+        # Look the engine up once and hand it to tell_joke; init_tts also
+        # renders the laugh in the background while the setup is told
+        tts_cmd = None
+        if use_speech:
+            from bbb.tts import init_tts
+            tts_cmd = init_tts()
+        if use_speech and not tts_cmd:
             print("Warning: No text-to-speech engine found. Install espeak or use macOS 'say' command.")
             print("Continuing without speech...")
-            use_speech = False
         
         # Show servo status
         if servo:
@@ -131,17 +104,17 @@ def main():
         try:
             jokes = load_jokes()
             joke = get_random_joke(jokes)
-            tell_joke(joke, use_speech)
+            tell_joke(joke, tts_cmd)
         finally:
             # Clean up servo
-            if servo:
-                servo.cleanup()
+            servo.cleanup()
     else:
         print("Usage: python sir.py joke [--speak|-s]")
         print("Alternative: python sir.py j [--speak|-s]")
         print("")
         print("Options:")
         print("  --speak, -s    Tell the joke out loud using text-to-speech")
+        from bbb.tts import check_tts_available
         tts_cmd = check_tts_available()
         if tts_cmd:
             print(f"  Text-to-speech engine detected: {tts_cmd}")
@@ -0,0 +1,234 @@
+let punchlineRevealed = false;
+let soundEnabled = false;
+
+// Servo control functions
+function triggerServoSetup() {
+    // Arm animation during joke setup: 0° → 180° → 0°
+    if (!servoConnected) return;
+    fetch('/api/servo/setup').catch(() => {});
+}
+
+function triggerServoPunchline() {
+    // Arm animation on punchline: 0° → 90° → 0°
+    if (!servoConnected) return;
+    fetch('/api/servo/punchline').catch(() => {});
+}
+
+function triggerServoSlap() {
+    // Full slap animation
+    if (!servoConnected) return;
+    fetch('/api/servo/slap').catch(() => {});
+}
+
+function triggerServoRelease() {
+    if (!servoConnected) return;
+    fetch('/api/servo/release').catch(() => {});
+}
+
+function setServoAngle(angle) {
+    fetch('/api/servo/angle?angle=' + angle)
+        .then(response => response.json())
+        .then(data => {
+            document.getElementById('servoAngle').textContent = 'Angle: ' + angle + '°';
+        })
+        .catch(() => {
+            document.getElementById('servoAngle').textContent = 'Error!';
+        });
+}
+
+function servoDown() {
+    setServoAngle(0);  // Hand down (touching ground)
+}
+
+function servoMiddle() {
+    setServoAngle(90);  // Hand at middle
+}
+
+function servoUp() {
+    setServoAngle(180);  // Hand up
+}
+
+function servoSlap() {
+    document.getElementById('servoAngle').textContent = 'Slapping...';
+    fetch('/api/servo/slap')
+        .then(response => response.json())
+        .then(data => {
+            document.getElementById('servoAngle').textContent = 'SLAP! 👋';
+            setTimeout(() => {
+                document.getElementById('servoAngle').textContent = 'Angle: 0°';
+            }, 1500);
+        })
+        .catch(() => {
+            document.getElementById('servoAngle').textContent = 'Error!';
+        });
+}
+
+function setVolume(level) {
+    document.getElementById('volumeValue').textContent = level + '%';
+    fetch('/api/volume/set?level=' + level).catch(() => {});
+}
+
+function setMaxVolume() {
+    document.getElementById('volumeSlider').value = 100;
+    document.getElementById('volumeValue').textContent = '100%';
+    fetch('/api/volume/max').catch(() => {});
+}
+
+// Set volume to max on page load
+window.addEventListener('load', () => {
+    setMaxVolume();
+});
+
+// With animate, the server also runs the matching arm animation (setup
+// animation with text, punchline animation with the laugh), saving a
+// request; a laugh with text speaks the text first, then laughs
+function speak(text, onEnd = null, isLaugh = false, animate = false) {
+    if (!soundEnabled) {
+        if (onEnd) onEnd();
+        return;
+    }
+
+    const indicator = document.getElementById('speakingIndicator');
+    indicator.classList.add('active');
+
+    // Estimate speech duration (rough: ~80ms per character for espeak)
+    const estimatedDuration = Math.max(1, text.length * 0.08);
+
+    // Call server-side TTS (Pi's speakers)
+    let url;
+    if (animate) {
+        url = '/api/say?' + (isLaugh ? 'laugh=1&' : '') + 'text=' + encodeURIComponent(text);
+    } else if (isLaugh) {
+        url = '/api/speak/laugh';
+    } else {
+        url = '/api/speak?text=' + encodeURIComponent(text);
+    }
+
+    fetch(url)
+        .then(response => response.json())
+        .then(data => {
+            // Wait for estimated speech duration before calling onEnd
+            setTimeout(() => {
+                indicator.classList.remove('active');
+                if (onEnd) onEnd();
+            }, estimatedDuration * 1000);
+        })
+        .catch(() => {
+            indicator.classList.remove('active');
+            if (onEnd) onEnd();
+        });
+}
+
+function toggleSound() {
+    soundEnabled = !soundEnabled;
+    const btn = document.getElementById('soundBtn');
+
+    if (soundEnabled) {
+        btn.textContent = '🔊 Sound On';
+        btn.classList.add('active');
+        // Speak current setup to confirm sound is working
+        speak(document.getElementById('setup').textContent);
+    } else {
+        btn.textContent = '🔇 Sound Off';
+        btn.classList.remove('active');
+        speechSynthesis.cancel();
+        document.getElementById('speakingIndicator').classList.remove('active');
+        triggerServoRelease();
+    }
+}
+
+function revealPunchline() {
+    if (punchlineRevealed) return;
+    punchlineRevealed = true;
+
+    document.getElementById('revealBtn').classList.add('hidden');
+    document.getElementById('punchline').classList.add('revealed');
+
+    const punchline = document.getElementById('punchline').textContent;
+    const estimatedDuration = Math.max(1, punchline.length * 0.08);
+
+    if (soundEnabled) {
+        // One request: the server speaks the punchline, then laughs with
+        // the arm going 0° → 90° → 0°
+        speak(punchline, () => {
+            setTimeout(() => {
+                document.getElementById('laugh').classList.add('visible');
+                createConfetti();
+            }, 300);
+        }, true, true);
+    } else {
+        // No sound - just show laugh and animate
+        setTimeout(() => {
+            document.getElementById('laugh').classList.add('visible');
+            createConfetti();
+            triggerServoPunchline();  // 0° → 90° → 0°
+        }, estimatedDuration * 1000);
+    }
+}
+
+function showJoke(data) {
+    punchlineRevealed = false;
+
+    document.getElementById('setup').textContent = data.setup;
+    document.getElementById('punchline').textContent = data.punchline;
+    document.getElementById('punchline').classList.remove('revealed');
+    document.getElementById('revealBtn').classList.remove('hidden');
+    document.getElementById('laugh').classList.remove('visible');
+}
+
+function getNewJoke() {
+    // Cancel any ongoing speech
+    speechSynthesis.cancel();
+
+    fetch('/api/joke')
+        .then(response => response.json())
+        .then(data => {
+            showJoke(data);
+
+            // Arm goes up during joke setup: 0° → 180° → 0° (this also
+            // cuts short whatever the arm was doing, and releases it after)
+            if (soundEnabled) {
+                // Speak the new setup along with it
+                speak(data.setup, null, false, true);
+            } else {
+                triggerServoSetup();
+            }
+        });
+}
+
+// The page itself is the same for everyone; fetch the first joke
+document.addEventListener('DOMContentLoaded', () => {
+    fetch('/api/joke')
+        .then(response => response.json())
+        .then(showJoke);
+});
+
+function createConfetti() {
+    const colors = ['#e94560', '#ffd93d', '#533483', '#a2d5f2', '#ff6b6b'];
+    for (let i = 0; i < 30; i++) {
+        setTimeout(() => {
+            const confetti = document.createElement('div');
+            confetti.className = 'confetti';
+            confetti.style.left = Math.random() * 100 + 'vw';
+            confetti.style.top = '-10px';
+            confetti.style.backgroundColor = colors[Math.floor(Math.random() * colors.length)];
+            confetti.style.borderRadius = Math.random() > 0.5 ? '50%' : '0';
+            confetti.style.animationDuration = (2 + Math.random() * 2) + 's';
+            document.body.appendChild(confetti);
+
+            setTimeout(() => confetti.remove(), 4000);
+        }, i * 50);
+    }
+}
+
+// Keyboard support
+document.addEventListener('keydown', (e) => {
+    if (e.code === 'Space' && !punchlineRevealed) {
+        e.preventDefault();
+        revealPunchline();
+    } else if (e.code === 'Enter') {
+        getNewJoke();
+    } else if (e.code === 'KeyS') {
+        toggleSound();
+    }
+});
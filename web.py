@@ -1,15 +1,19 @@
 #!/usr/bin/env python3
 
-from flask import Flask, render_template_string, jsonify, request
-import json
+from collections import deque
+from flask import Flask, Response, jsonify, request
+import gzip
+import hashlib
 import os
 import random
 import subprocess
 import sys
 import threading
-import time
 
 app = Flask(__name__)
+# Static asset URLs carry a hash of the file's contents (see
+# _asset_version), so browsers can keep them for a year without revalidating
+app.config['SEND_FILE_MAX_AGE_DEFAULT'] = 365 * 24 * 60 * 60
 
 # Get the directory where this script lives
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -26,33 +30,71 @@ from bbb.servo import (
     joke_setup_animation,
     punchline_animation,
     hand_slap_animation,
+    start_animation,
     HAND_DOWN,
     HAND_UP,
     HAND_MIDDLE,
     GPIO_PIN,
 )
+from bbb.jokes import get_jokes
 from bbb.tts import (
     init_tts,
     get_tts_command,
+    get_tts_error,
+    is_speech_queued,
     speak_text_sync,
     speak_text_async,
 )
 
-# Initialize servo (skip in Flask reloader process)
-servo, servo_error = init_servo(skip_if_reloader=True)
+# Initialize servo (skip in Flask reloader process). Run as a script there's
+# never a reloader (see app.run below), even with FLASK_DEBUG=1 for the debugger
+servo, servo_error = init_servo(skip_if_reloader=__name__ != '__main__')
 servo_lock = get_servo_lock()
 
-# Initialize TTS
-tts_command = init_tts()
+# Initialize TTS (keep espeak warm between requests)
+tts_command = init_tts(persistent=True)
 
 
-def load_jokes():
-    jokes_path = os.path.join(SCRIPT_DIR, 'dad_jokes.json')
-    with open(jokes_path, 'r') as f:
-        data = json.load(f)
-        return data['jokes']
+# Immutable, since request threads share it
+JOKES = get_jokes()
+JOKE_COUNT = len(JOKES)
+if not JOKE_COUNT:
+    # random_joke_index would have nothing to deal
+    print("Error: No jokes in dad_jokes.json!")
+    sys.exit(1)
+
+# Joke indices in shuffled order, dealt out one at a time and refilled
+# with a fresh shuffle once they've all been used (so no repeats until
+# every joke has been told). deque.popleft() is atomic, so only a refill
+# takes the lock.
+_joke_order = deque()
+_joke_order_lock = threading.Lock()
+
+
+def random_joke_index():
+    """Deal the next joke index from the shuffled order."""
+    while True:
+        try:
+            return _joke_order.popleft()
+        except IndexError:
+            with _joke_order_lock:
+                if not _joke_order:
+                    _joke_order.extend(random.sample(range(JOKE_COUNT), JOKE_COUNT))
+
+
+# Each joke's /api/joke body, encoded once (exactly what jsonify would send)
+JOKES_JSON = tuple((app.json.dumps(joke, separators=(',', ':')) + '\n').encode()
+                   for joke in JOKES)
+
+# The fixed /api/servo/* replies, encoded once (the same bytes as jsonify)
+_OK_JSON = b'{"status":"ok"}\n'
+_NO_SERVO_JSON = b'{"status":"no_servo"}\n'
+
+
+def _json_reply(body):
+    """A JSON response for an already-encoded body."""
+    return Response(body, mimetype='application/json')
 
-JOKES = load_jokes()
 
 HTML_TEMPLATE = '''
 <!DOCTYPE html>
@@ -64,426 +106,7 @@ HTML_TEMPLATE = '''
     <link rel="preconnect" href="https://fonts.googleapis.com">
     <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
     <link href="https://fonts.googleapis.com/css2?family=Bangers&family=Patrick+Hand&display=swap" rel="stylesheet">
-    <style>
-        * {
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }
-
-        body {
-            min-height: 100vh;
-            font-family: 'Patrick Hand', cursive;
-            background: linear-gradient(135deg, #1a1a2e 0%, #16213e 50%, #0f3460 100%);
-            color: #fff;
-            display: flex;
-            flex-direction: column;
-            align-items: center;
-            justify-content: center;
-            padding: 20px;
-            overflow-x: hidden;
-        }
-
-        /* Floating emoji background */
-        .bg-emoji {
-            position: fixed;
-            font-size: 2rem;
-            opacity: 0.1;
-            animation: float 20s infinite ease-in-out;
-            pointer-events: none;
-            z-index: 0;
-        }
-
-        @keyframes float {
-            0%, 100% { transform: translateY(0) rotate(0deg); }
-            25% { transform: translateY(-20px) rotate(5deg); }
-            50% { transform: translateY(0) rotate(0deg); }
-            75% { transform: translateY(20px) rotate(-5deg); }
-        }
-
-        .container {
-            max-width: 700px;
-            width: 100%;
-            text-align: center;
-            z-index: 1;
-            position: relative;
-        }
-
-        .header {
-            margin-bottom: 2rem;
-        }
-
-        .title {
-            font-family: 'Bangers', cursive;
-            font-size: 4.5rem;
-            color: #e94560;
-            text-shadow: 4px 4px 0 #533483, 8px 8px 0 rgba(0,0,0,0.2);
-            letter-spacing: 0.1em;
-            animation: titleBounce 2s ease-in-out infinite;
-        }
-
-        @keyframes titleBounce {
-            0%, 100% { transform: scale(1); }
-            50% { transform: scale(1.02); }
-        }
-
-        .subtitle {
-            font-size: 1.5rem;
-            color: #a2d5f2;
-            margin-top: 0.5rem;
-            opacity: 0.9;
-        }
-
-        .robot-icon {
-            font-size: 5rem;
-            display: block;
-            margin: 1rem auto;
-            animation: robotWobble 3s ease-in-out infinite;
-        }
-
-        @keyframes robotWobble {
-            0%, 100% { transform: rotate(-5deg); }
-            50% { transform: rotate(5deg); }
-        }
-
-        .joke-card {
-            background: linear-gradient(145deg, #533483 0%, #e94560 100%);
-            border-radius: 24px;
-            padding: 3rem 2rem;
-            margin: 2rem 0;
-            box-shadow: 
-                0 20px 60px rgba(233, 69, 96, 0.3),
-                0 0 0 1px rgba(255,255,255,0.1) inset;
-            position: relative;
-            overflow: hidden;
-        }
-
-        .joke-card::before {
-            content: '';
-            position: absolute;
-            top: -50%;
-            left: -50%;
-            width: 200%;
-            height: 200%;
-            background: radial-gradient(circle, rgba(255,255,255,0.1) 0%, transparent 60%);
-            animation: shimmer 8s linear infinite;
-        }
-
-        @keyframes shimmer {
-            0% { transform: rotate(0deg); }
-            100% { transform: rotate(360deg); }
-        }
-
-        .setup {
-            font-size: 1.8rem;
-            line-height: 1.4;
-            margin-bottom: 1.5rem;
-            position: relative;
-            z-index: 1;
-        }
-
-        .punchline-container {
-            min-height: 80px;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            position: relative;
-            z-index: 1;
-        }
-
-        .punchline {
-            font-size: 2rem;
-            font-weight: bold;
-            color: #ffd93d;
-            text-shadow: 2px 2px 4px rgba(0,0,0,0.3);
-            opacity: 0;
-            transform: translateY(20px) scale(0.8);
-            transition: all 0.5s cubic-bezier(0.68, -0.55, 0.265, 1.55);
-        }
-
-        .punchline.revealed {
-            opacity: 1;
-            transform: translateY(0) scale(1);
-        }
-
-        .reveal-prompt {
-            color: rgba(255,255,255,0.7);
-            font-size: 1.2rem;
-            cursor: pointer;
-            padding: 0.8rem 1.5rem;
-            border: 2px dashed rgba(255,255,255,0.4);
-            border-radius: 12px;
-            transition: all 0.3s ease;
-            animation: pulse 2s ease-in-out infinite;
-        }
-
-        .reveal-prompt:hover {
-            background: rgba(255,255,255,0.1);
-            border-color: rgba(255,255,255,0.8);
-        }
-
-        @keyframes pulse {
-            0%, 100% { opacity: 0.7; }
-            50% { opacity: 1; }
-        }
-
-        .reveal-prompt.hidden {
-            display: none;
-        }
-
-        .laugh {
-            font-size: 1.5rem;
-            margin-top: 1rem;
-            opacity: 0;
-            transition: opacity 0.5s ease 0.3s;
-        }
-
-        .laugh.visible {
-            opacity: 1;
-        }
-
-        .btn {
-            font-family: 'Bangers', cursive;
-            font-size: 1.5rem;
-            letter-spacing: 0.05em;
-            padding: 1rem 2.5rem;
-            border: none;
-            border-radius: 50px;
-            cursor: pointer;
-            transition: all 0.3s ease;
-            position: relative;
-            overflow: hidden;
-        }
-
-        .btn-primary {
-            background: linear-gradient(135deg, #ffd93d 0%, #ff6b6b 100%);
-            color: #1a1a2e;
-            box-shadow: 0 8px 30px rgba(255, 217, 61, 0.4);
-        }
-
-        .btn-primary:hover {
-            transform: translateY(-3px) scale(1.05);
-            box-shadow: 0 12px 40px rgba(255, 217, 61, 0.5);
-        }
-
-        .btn-primary:active {
-            transform: translateY(0) scale(0.98);
-        }
-
-        .btn::after {
-            content: '';
-            position: absolute;
-            top: 50%;
-            left: 50%;
-            width: 0;
-            height: 0;
-            background: rgba(255,255,255,0.3);
-            border-radius: 50%;
-            transform: translate(-50%, -50%);
-            transition: width 0.6s ease, height 0.6s ease;
-        }
-
-        .btn:active::after {
-            width: 300px;
-            height: 300px;
-        }
-
-        .stats {
-            margin-top: 2rem;
-            color: #a2d5f2;
-            font-size: 1rem;
-            opacity: 0.7;
-        }
-
-        .controls {
-            display: flex;
-            gap: 1rem;
-            justify-content: center;
-            align-items: center;
-            flex-wrap: wrap;
-        }
-
-        .btn-sound {
-            background: rgba(255,255,255,0.1);
-            color: #fff;
-            border: 2px solid rgba(255,255,255,0.3);
-            font-size: 1.2rem;
-            padding: 0.8rem 1.5rem;
-        }
-
-        .btn-sound:hover {
-            background: rgba(255,255,255,0.2);
-            border-color: rgba(255,255,255,0.5);
-            transform: translateY(-2px);
-        }
-
-        .btn-sound.active {
-            background: linear-gradient(135deg, #533483 0%, #e94560 100%);
-            border-color: #e94560;
-            box-shadow: 0 4px 20px rgba(233, 69, 96, 0.4);
-        }
-
-        .speaking-indicator {
-            display: inline-block;
-            margin-left: 0.5rem;
-            opacity: 0;
-            transition: opacity 0.3s ease;
-        }
-
-        .speaking-indicator.active {
-            opacity: 1;
-            animation: speakPulse 0.5s ease-in-out infinite;
-        }
-
-        @keyframes speakPulse {
-            0%, 100% { transform: scale(1); }
-            50% { transform: scale(1.2); }
-        }
-
-        .servo-status {
-            font-size: 0.85rem;
-            margin-top: 0.5rem;
-        }
-
-        .servo-status.connected {
-            color: #4ade80;
-        }
-
-        .servo-status.disconnected {
-            color: #f87171;
-        }
-
-        .servo-controls {
-            margin-top: 1.5rem;
-            padding: 1rem;
-            background: rgba(255,255,255,0.05);
-            border-radius: 12px;
-            border: 1px solid rgba(255,255,255,0.1);
-        }
-
-        .servo-controls-title {
-            font-size: 1rem;
-            color: #a2d5f2;
-            margin-bottom: 0.75rem;
-        }
-
-        .servo-buttons {
-            display: flex;
-            gap: 0.5rem;
-            justify-content: center;
-            flex-wrap: wrap;
-        }
-
-        .btn-servo {
-            background: rgba(255,255,255,0.1);
-            color: #fff;
-            border: 1px solid rgba(255,255,255,0.2);
-            font-size: 0.9rem;
-            padding: 0.5rem 1rem;
-            border-radius: 8px;
-        }
-
-        .btn-servo:hover {
-            background: rgba(255,255,255,0.2);
-            border-color: rgba(255,255,255,0.4);
-            transform: translateY(-2px);
-        }
-
-        .btn-servo:active {
-            transform: translateY(0);
-            background: rgba(83, 52, 131, 0.5);
-        }
-
-        .servo-angle {
-            font-size: 0.85rem;
-            color: #ffd93d;
-            margin-top: 0.5rem;
-        }
-
-        .volume-control {
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            gap: 1rem;
-            margin-bottom: 0.75rem;
-        }
-
-        .volume-slider {
-            width: 200px;
-            height: 8px;
-            border-radius: 4px;
-            background: rgba(255,255,255,0.2);
-            outline: none;
-            -webkit-appearance: none;
-        }
-
-        .volume-slider::-webkit-slider-thumb {
-            -webkit-appearance: none;
-            width: 24px;
-            height: 24px;
-            border-radius: 50%;
-            background: linear-gradient(135deg, #ffd93d 0%, #ff6b6b 100%);
-            cursor: pointer;
-            box-shadow: 0 2px 10px rgba(255, 217, 61, 0.4);
-        }
-
-        .volume-slider::-moz-range-thumb {
-            width: 24px;
-            height: 24px;
-            border-radius: 50%;
-            background: linear-gradient(135deg, #ffd93d 0%, #ff6b6b 100%);
-            cursor: pointer;
-            border: none;
-        }
-
-        #volumeValue {
-            font-size: 1.1rem;
-            color: #ffd93d;
-            min-width: 50px;
-        }
-
-        .footer {
-            margin-top: 3rem;
-            color: rgba(255,255,255,0.4);
-            font-size: 0.9rem;
-        }
-
-        /* Confetti animation on reveal */
-        .confetti {
-            position: fixed;
-            width: 10px;
-            height: 10px;
-            pointer-events: none;
-            z-index: 100;
-            animation: confettiFall 3s ease-out forwards;
-        }
-
-        @keyframes confettiFall {
-            0% {
-                transform: translateY(0) rotate(0deg);
-                opacity: 1;
-            }
-            100% {
-                transform: translateY(100vh) rotate(720deg);
-                opacity: 0;
-            }
-        }
-
-        @media (max-width: 600px) {
-            .title {
-                font-size: 3rem;
-            }
-            .setup {
-                font-size: 1.4rem;
-            }
-            .punchline {
-                font-size: 1.6rem;
-            }
-            .joke-card {
-                padding: 2rem 1.5rem;
-            }
-        }
-    </style>
+    <link rel="stylesheet" href="{{ url_for('static', filename='style.css', v=asset_version('style.css')) }}">
 </head>
 <body>
     <!-- Floating background emojis -->
@@ -502,12 +125,12 @@ HTML_TEMPLATE = '''
         </header>
 
         <div class="joke-card">
-            <p class="setup" id="setup">{{ setup }}</p>
+            <p class="setup" id="setup">Loading a joke...</p>
             <div class="punchline-container">
                 <span class="reveal-prompt" id="revealBtn" onclick="revealPunchline()">
                     👆 Tap to reveal punchline
                 </span>
-                <p class="punchline" id="punchline">{{ punchline }}</p>
+                <p class="punchline" id="punchline"></p>
             </div>
             <p class="laugh" id="laugh">😂 Ha ha ha! That's a good one!</p>
         </div>
@@ -564,293 +187,122 @@ HTML_TEMPLATE = '''
     </div>
 
     <script>
-        let punchlineRevealed = false;
-        let soundEnabled = false;
         const servoConnected = {{ 'true' if servo_connected else 'false' }};
         const ttsAvailable = {{ 'true' if tts_available else 'false' }};
-
-        // Servo control functions
-        function triggerServoSetup() {
-            // Arm animation during joke setup: 0° → 180° → 0°
-            if (!servoConnected) return;
-            fetch('/api/servo/setup').catch(() => {});
-        }
-
-        function triggerServoPunchline() {
-            // Arm animation on punchline: 0° → 90° → 0°
-            if (!servoConnected) return;
-            fetch('/api/servo/punchline').catch(() => {});
-        }
-
-        function triggerServoSlap() {
-            // Full slap animation
-            if (!servoConnected) return;
-            fetch('/api/servo/slap').catch(() => {});
-        }
-
-        function triggerServoRelease() {
-            if (!servoConnected) return;
-            fetch('/api/servo/release').catch(() => {});
-        }
-
-        function setServoAngle(angle) {
-            fetch('/api/servo/angle?angle=' + angle)
-                .then(response => response.json())
-                .then(data => {
-                    document.getElementById('servoAngle').textContent = 'Angle: ' + angle + '°';
-                })
-                .catch(() => {
-                    document.getElementById('servoAngle').textContent = 'Error!';
-                });
-        }
-
-        function servoDown() {
-            setServoAngle(0);  // Hand down (touching ground)
-        }
-
-        function servoMiddle() {
-            setServoAngle(90);  // Hand at middle
-        }
-
-        function servoUp() {
-            setServoAngle(180);  // Hand up
-        }
-
-        function servoSlap() {
-            document.getElementById('servoAngle').textContent = 'Slapping...';
-            fetch('/api/servo/slap')
-                .then(response => response.json())
-                .then(data => {
-                    document.getElementById('servoAngle').textContent = 'SLAP! 👋';
-                    setTimeout(() => {
-                        document.getElementById('servoAngle').textContent = 'Angle: 0°';
-                    }, 1500);
-                })
-                .catch(() => {
-                    document.getElementById('servoAngle').textContent = 'Error!';
-                });
-        }
-
-        function setVolume(level) {
-            document.getElementById('volumeValue').textContent = level + '%';
-            fetch('/api/volume/set?level=' + level).catch(() => {});
-        }
-
-        function setMaxVolume() {
-            document.getElementById('volumeSlider').value = 100;
-            document.getElementById('volumeValue').textContent = '100%';
-            fetch('/api/volume/max').catch(() => {});
-        }
-
-        // Set volume to max on page load
-        window.addEventListener('load', () => {
-            setMaxVolume();
-        });
-
-        function speak(text, onEnd = null, isLaugh = false) {
-            if (!soundEnabled) {
-                if (onEnd) onEnd();
-                return;
-            }
-            
-            const indicator = document.getElementById('speakingIndicator');
-            indicator.classList.add('active');
-            
-            // Estimate speech duration (rough: ~80ms per character for espeak)
-            const estimatedDuration = Math.max(1, text.length * 0.08);
-            
-            // Call server-side TTS (Pi's speakers)
-            let url;
-            if (isLaugh) {
-                url = '/api/speak/laugh';
-            } else {
-                url = '/api/speak?text=' + encodeURIComponent(text);
-            }
-            
-            fetch(url)
-                .then(response => response.json())
-                .then(data => {
-                    // Wait for estimated speech duration before calling onEnd
-                    setTimeout(() => {
-                        indicator.classList.remove('active');
-                        if (onEnd) onEnd();
-                    }, estimatedDuration * 1000);
-                })
-                .catch(() => {
-                    indicator.classList.remove('active');
-                    if (onEnd) onEnd();
-                });
-        }
-
-        function toggleSound() {
-            soundEnabled = !soundEnabled;
-            const btn = document.getElementById('soundBtn');
-            
-            if (soundEnabled) {
-                btn.textContent = '🔊 Sound On';
-                btn.classList.add('active');
-                // Speak current setup to confirm sound is working
-                speak(document.getElementById('setup').textContent);
-            } else {
-                btn.textContent = '🔇 Sound Off';
-                btn.classList.remove('active');
-                speechSynthesis.cancel();
-                document.getElementById('speakingIndicator').classList.remove('active');
-                triggerServoRelease();
-            }
-        }
-
-        function revealPunchline() {
-            if (punchlineRevealed) return;
-            punchlineRevealed = true;
-            
-            document.getElementById('revealBtn').classList.add('hidden');
-            document.getElementById('punchline').classList.add('revealed');
-            
-            const punchline = document.getElementById('punchline').textContent;
-            const estimatedDuration = Math.max(1, punchline.length * 0.08);
-            
-            if (soundEnabled) {
-                // Speak the punchline, then animate arm
-                speak(punchline, () => {
-                    setTimeout(() => {
-                        document.getElementById('laugh').classList.add('visible');
-                        createConfetti();
-                        triggerServoPunchline();  // 0° → 90° → 0°
-                        speak("Ha ha ha ha! That's a good one!", null, true);
-                    }, 300);
-                });
-            } else {
-                // No sound - just show laugh and animate
-                setTimeout(() => {
-                    document.getElementById('laugh').classList.add('visible');
-                    createConfetti();
-                    triggerServoPunchline();  // 0° → 90° → 0°
-                }, estimatedDuration * 1000);
-            }
-        }
-
-        function getNewJoke() {
-            // Cancel any ongoing speech
-            speechSynthesis.cancel();
-            triggerServoRelease();
-            
-            fetch('/api/joke')
-                .then(response => response.json())
-                .then(data => {
-                    punchlineRevealed = false;
-                    
-                    document.getElementById('setup').textContent = data.setup;
-                    document.getElementById('punchline').textContent = data.punchline;
-                    document.getElementById('punchline').classList.remove('revealed');
-                    document.getElementById('revealBtn').classList.remove('hidden');
-                    document.getElementById('laugh').classList.remove('visible');
-                    
-                    // Arm goes up during joke setup: 0° → 180° → 0°
-                    triggerServoSetup();
-                    
-                    if (soundEnabled) {
-                        // Speak the new setup
-                        speak(data.setup);
-                    }
-                });
-        }
-
-        function createConfetti() {
-            const colors = ['#e94560', '#ffd93d', '#533483', '#a2d5f2', '#ff6b6b'];
-            for (let i = 0; i < 30; i++) {
-                setTimeout(() => {
-                    const confetti = document.createElement('div');
-                    confetti.className = 'confetti';
-                    confetti.style.left = Math.random() * 100 + 'vw';
-                    confetti.style.top = '-10px';
-                    confetti.style.backgroundColor = colors[Math.floor(Math.random() * colors.length)];
-                    confetti.style.borderRadius = Math.random() > 0.5 ? '50%' : '0';
-                    confetti.style.animationDuration = (2 + Math.random() * 2) + 's';
-                    document.body.appendChild(confetti);
-                    
-                    setTimeout(() => confetti.remove(), 4000);
-                }, i * 50);
-            }
-        }
-
-        // Keyboard support
-        document.addEventListener('keydown', (e) => {
-            if (e.code === 'Space' && !punchlineRevealed) {
-                e.preventDefault();
-                revealPunchline();
-            } else if (e.code === 'Enter') {
-                getNewJoke();
-            } else if (e.code === 'KeyS') {
-                toggleSound();
-            }
-        });
     </script>
+    <script src="{{ url_for('static', filename='app.js', v=asset_version('app.js')) }}"></script>
 </body>
 </html>
 '''
 
+
+def _asset_version(filename):
+    """Short hash of a static file's contents, to make its URL change with it."""
+    with open(os.path.join(app.static_folder, filename), 'rb') as f:
+        return hashlib.sha1(f.read()).hexdigest()[:10]
+
+
+def _render_page():
+    """
+    Render the page once. Nothing in it changes after startup (the
+    script fetches the joke from /api/joke), so every request gets the
+    same bytes.
+    
+    Returns:
+        bytes: The UTF-8 page
+    """
+    # A request context so url_for() can build the static asset URLs
+    with app.test_request_context():
+        page = app.jinja_env.from_string(HTML_TEMPLATE).render(
+            total_jokes=JOKE_COUNT,
+            servo_connected=(servo is not None),
+            servo_error=servo_error,
+            tts_available=(tts_command is not None),
+            tts_engine=tts_command,
+            asset_version=_asset_version
+        )
+    # Drop indentation and blank lines (the template has no <pre> or
+    # multi-line JS strings, and line breaks are kept as separators)
+    page = '\n'.join(line.strip() for line in page.splitlines() if line.strip())
+    return page.encode()
+
+
+_PAGE = _render_page()
+_PAGE_ETAG = hashlib.sha1(_PAGE).hexdigest()
+
+# The page compressed once, best first: (encoding, body) pairs
+_PAGE_ENCODINGS = []
+try:
+    import brotli  # Optional, compresses smaller than gzip
+    _PAGE_ENCODINGS.append(('br', brotli.compress(_PAGE, quality=11)))
+except ImportError:
+    pass
+_PAGE_ENCODINGS.append(('gzip', gzip.compress(_PAGE, compresslevel=9, mtime=0)))
+
+
 @app.route('/')
 def index():
-    joke = random.choice(JOKES)
-    return render_template_string(
-        HTML_TEMPLATE,
-        setup=joke['setup'],
-        punchline=joke['punchline'],
-        total_jokes=len(JOKES),
-        servo_connected=(servo is not None),
-        servo_error=servo_error,
-        tts_available=(tts_command is not None),
-        tts_engine=tts_command
-    )
+    for encoding, body in _PAGE_ENCODINGS:
+        if request.accept_encodings[encoding]:
+            response = Response(body, mimetype='text/html')
+            response.headers['Content-Encoding'] = encoding
+            response.set_etag(f'{_PAGE_ETAG}-{encoding}')
+            break
+    else:
+        response = Response(_PAGE, mimetype='text/html')
+        response.set_etag(_PAGE_ETAG)
+    response.vary.add('Accept-Encoding')
+    # Browsers may keep it, but must check the ETag (the servo/TTS status
+    # in it can change when the server restarts); unchanged -> 304
+    response.headers['Cache-Control'] = 'no-cache'
+    return response.make_conditional(request)
 
 @app.route('/api/joke')
 def api_joke():
-    joke = random.choice(JOKES)
-    return jsonify(joke)
+    response = Response(JOKES_JSON[random_joke_index()], mimetype='application/json')
+    # A different joke every time, so never reuse a cached one
+    response.headers['Cache-Control'] = 'no-cache'
+    return response
 
 @app.route('/api/servo/setup')
 def api_servo_setup():
     """Trigger setup animation: 0° → 180° → 0° (during joke telling)."""
     if not servo:
-        return jsonify({'status': 'no_servo'})
+        return _json_reply(_NO_SERVO_JSON)
     
-    # Run animation in background thread with locking
-    thread = threading.Thread(target=joke_setup_animation, args=(True,))
-    thread.start()
-    return jsonify({'status': 'ok'})
+    # Run animation on the animation thread with locking
+    start_animation(joke_setup_animation, True)
+    return _json_reply(_OK_JSON)
 
 @app.route('/api/servo/punchline')
 def api_servo_punchline():
     """Trigger punchline animation: 0° → 90° → 0°."""
     if not servo:
-        return jsonify({'status': 'no_servo'})
+        return _json_reply(_NO_SERVO_JSON)
     
-    # Run animation in background thread with locking
-    thread = threading.Thread(target=punchline_animation, args=(True,))
-    thread.start()
-    return jsonify({'status': 'ok'})
+    # Run animation on the animation thread with locking
+    start_animation(punchline_animation, True)
+    return _json_reply(_OK_JSON)
 
 @app.route('/api/servo/slap')
 def api_servo_slap():
     """Trigger full slap animation: 0° → 180° → 0° → 90° → 0°."""
     if not servo:
-        return jsonify({'status': 'no_servo'})
+        return _json_reply(_NO_SERVO_JSON)
     
-    # Run slap animation in background thread with locking
-    thread = threading.Thread(target=hand_slap_animation, args=(True,))
-    thread.start()
-    return jsonify({'status': 'ok'})
+    # Run slap animation on the animation thread with locking
+    start_animation(hand_slap_animation, True)
+    return _json_reply(_OK_JSON)
 
 @app.route('/api/servo/release')
 def api_servo_release():
     """Release the servo."""
     if not servo:
-        return jsonify({'status': 'no_servo'})
+        return _json_reply(_NO_SERVO_JSON)
     
     with servo_lock:
         servo.release()
-    return jsonify({'status': 'ok'})
+    return _json_reply(_OK_JSON)
 
 @app.route('/api/servo/status')
 def api_servo_status():
@@ -884,16 +336,15 @@ def api_servo_test():
     if not servo:
         return jsonify({'status': 'no_servo', 'error': 'Servo not connected'})
     
-    def test_sequence():
+    def test_sequence(stop):
         # First do setup animation
-        joke_setup_animation(True)
-        time.sleep(0.5)
-        # Then punchline animation
-        punchline_animation(True)
+        joke_setup_animation(True, stop)
+        # Then punchline animation (unless another animation took over)
+        if not stop.wait(0.5):
+            punchline_animation(True, stop)
     
-    # Run test in background thread
-    thread = threading.Thread(target=test_sequence)
-    thread.start()
+    # Run test on the animation thread
+    start_animation(test_sequence)
     
     return jsonify({'status': 'ok', 'message': 'Test sequence started'})
 
@@ -921,12 +372,59 @@ def api_speak_laugh():
     speak_text_async("", is_laugh=True)
     return jsonify({'status': 'ok'})
 
+# Rough speaking time per character (as the page estimates it), for timing
+# the arm when espeak only queues the speech
+_SPEECH_SECONDS_PER_CHAR = 0.08
+
+@app.route('/api/say')
+def api_say():
+    """
+    Speak and run the arm animation that goes with it, in one request: the
+    setup animation with text, or with laugh=1 the punchline animation with
+    the laugh (after speaking text first, if given). The arm starts moving
+    when the speech it goes with starts playing, or, when speech is only
+    queued on the running espeak, after an estimate of the text's length.
+    """
+    is_laugh = request.args.get('laugh') == '1'
+    text = request.args.get('text', '')
+    if not text and not is_laugh:
+        return jsonify({'status': 'error', 'error': 'No text provided'})
+    
+    animation = punchline_animation if is_laugh else joke_setup_animation
+    on_start = None
+    if servo:
+        if tts_command and not is_speech_queued():
+            on_start = lambda duration: start_animation(animation, True)
+        elif tts_command and is_laugh and text:
+            # espeak only queues the lines, so there's no playback start to
+            # go by: move the arm once the punchline has probably been said
+            timer = threading.Timer(len(text) * _SPEECH_SECONDS_PER_CHAR + 0.3,
+                                    start_animation, (animation, True))
+            timer.daemon = True
+            timer.start()
+        else:
+            start_animation(animation, True)
+    
+    if tts_command:
+        if is_laugh:
+            if text:
+                speak_text_async(text)  # The TTS thread speaks these in order
+            speak_text_async("", is_laugh=True, on_start=on_start)
+        else:
+            speak_text_async(text, on_start=on_start)
+    return jsonify({
+        'status': 'ok',
+        'servo': servo is not None,
+        'tts': tts_command is not None
+    })
+
 @app.route('/api/tts/status')
 def api_tts_status():
     """Get TTS status."""
     return jsonify({
         'available': tts_command is not None,
-        'engine': tts_command
+        'engine': tts_command,
+        'error': get_tts_error()
     })
 
 @app.route('/api/volume/set')
@@ -956,5 +454,25 @@ def api_volume_max():
         return jsonify({'status': 'error', 'error': str(e)})
 
 if __name__ == '__main__':
-    # use_reloader=False prevents Flask from starting twice and causing "GPIO busy"
-    app.run(host='0.0.0.0', port=5000, debug=True, use_reloader=False)
+    try:
+        from waitress import serve  # Optional production WSGI server
+    except ImportError:
+        serve = None
+    
+    if serve:
+        # One process (it owns the servo's GPIO and the TTS lock), with
+        # threads so slow requests (speech, animations) don't block the rest
+        print("🌐 Serving with waitress on port 5000")
+        serve(app, host='0.0.0.0', port=5000, threads=8)
+    else:
+        # Development server (pip install waitress for the real thing, or
+        # run: gunicorn -w 1 --threads 8 -b 0.0.0.0:5000 web:app). The
+        # debugger is off unless FLASK_DEBUG=1, as it slows every request
+        # and shouldn't be reachable from the network anyway
+        # HTTP/1.1 so the page's many small API requests reuse a connection
+        # (waitress and gunicorn keep connections alive already)
+        from werkzeug.serving import WSGIRequestHandler
+        WSGIRequestHandler.protocol_version = 'HTTP/1.1'
+        
+        # use_reloader=False prevents Flask from starting twice and causing "GPIO busy"
+        app.run(host='0.0.0.0', port=5000, use_reloader=False, threaded=True)